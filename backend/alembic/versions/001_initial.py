@@ -42,8 +42,20 @@ def upgrade() -> None:
         sa.Column('config', postgresql.JSON, nullable=True),
     )
 
+    # Indexes for listing/filtering jobs by status and recency
+    op.create_index('ix_jobs_status', 'jobs', ['status'])
+    op.create_index('ix_jobs_created_at', 'jobs', [sa.text('created_at DESC')])
+    op.create_index(
+        'ix_jobs_status_created_at',
+        'jobs',
+        ['status', sa.text('created_at DESC')],
+    )
+
 
 def downgrade() -> None:
+    op.drop_index('ix_jobs_status_created_at', table_name='jobs')
+    op.drop_index('ix_jobs_created_at', table_name='jobs')
+    op.drop_index('ix_jobs_status', table_name='jobs')
     op.drop_table('jobs')
 
 
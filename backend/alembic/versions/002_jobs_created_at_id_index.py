@@ -0,0 +1,28 @@
+"""Add keyset pagination index on jobs
+
+Revision ID: 002_jobs_created_at_id_index
+Revises: 001_initial
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_jobs_created_at_id_index'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches the (created_at DESC, id DESC) ordering used by list_jobs
+    op.create_index(
+        'ix_jobs_created_at_id',
+        'jobs',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
@@ -0,0 +1,28 @@
+"""Store job status and stages as enum values
+
+Revision ID: 003_enum_values
+Revises: 002_jobs_created_at_id_index
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_enum_values'
+down_revision = '002_jobs_created_at_id_index'
+branch_labels = None
+depends_on = None
+
+ENUM_COLUMNS = ('status', 'extraction_stage', 'ocr_stage', 'translation_stage')
+
+
+def upgrade() -> None:
+    # SQLEnum stored member names (e.g. IN_PROGRESS); StringEnum stores values
+    for column in ENUM_COLUMNS:
+        op.execute(f"UPDATE jobs SET {column} = LOWER({column})")
+
+
+def downgrade() -> None:
+    for column in ENUM_COLUMNS:
+        op.execute(f"UPDATE jobs SET {column} = UPPER({column})")
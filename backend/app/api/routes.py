@@ -1,10 +1,13 @@
 """API route handlers."""
 
+import base64
 import logging
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from uuid import UUID
+from typing import List, Optional, Tuple
+from urllib.parse import quote
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
@@ -15,14 +18,19 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse, JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response
+import orjson
+from sqlalchemy import func, text, tuple_
+from sqlalchemy.orm import Session, undefer_group
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import engine, get_db
 from app.models import Job, JobStatus
+from app.redis_client import get_redis
 from app.schemas import (
     HealthResponse,
+    JobBulkCreateResponse,
     JobCreateResponse,
     JobListResponse,
     JobResponse,
@@ -31,7 +39,11 @@ from app.schemas import (
     ProcessingStages,
 )
 from app.tasks import process_document_task
+from app.utils import job_cache
+from app.utils.model_status import get_model_status
 from app.utils.file_handler import (
+    FileTooLargeError,
+    get_results_dir,
     is_allowed_file_type,
     save_uploaded_file,
 )
@@ -46,14 +58,21 @@ settings = get_settings()
 
 router = APIRouter(prefix="/api", tags=["api"])
 
+# Listed in upload rejection messages
+_ALLOWED_EXTENSIONS_DISPLAY = ", ".join(sorted(settings.allowed_file_extensions))
+
+# Built once and reused by every health probe
+_PING_STATEMENT = text("SELECT 1")
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check(db: Session = Depends(get_db)):
+async def health_check():
     """Health check endpoint."""
-    # Check database
+    # Check database with a bare pooled connection rather than an ORM session
     db_status = "connected"
     try:
-        db.execute("SELECT 1")
+        with engine.connect() as connection:
+            connection.execute(_PING_STATEMENT)
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         db_status = "disconnected"
@@ -64,33 +83,13 @@ async def health_check(db: Session = Depends(get_db)):
     else:
         redis_status = "connected"
         try:
-            import redis
-
-            r = redis.from_url(settings.redis_url)
-            r.ping()
+            get_redis().ping()
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
             redis_status = "disconnected"
 
-    # Check models (simplified - just check if they can be loaded)
-    models_status = {}
-    try:
-        # Check PaddleOCR
-        from app.services.ocr import _get_paddleocr
-
-        _get_paddleocr()
-        models_status["paddleocr"] = "loaded"
-    except Exception:
-        models_status["paddleocr"] = "not_loaded"
-
-    try:
-        # Check translation model
-        from app.services.translate import _load_translation_model
-
-        _load_translation_model()
-        models_status["nllb"] = "loaded"
-    except Exception:
-        models_status["nllb"] = "not_loaded"
+    # Model status is reported by the workers; never load models here
+    models_status = get_model_status()
 
     overall_status = "healthy" if db_status == "connected" and redis_status == "connected" else "degraded"
 
@@ -103,59 +102,74 @@ async def health_check(db: Session = Depends(get_db)):
     )
 
 
-@router.post("/jobs", response_model=JobCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_job(
-    file: UploadFile = File(...),
-    source_language: str = Query(default="ar", description="Source language code"),
-    target_language: str = Query(default="en", description="Target language code"),
-    preserve_layout: bool = Query(default=True, description="Preserve document layout"),
-    ocr_engine: str = Query(
-        default="paddleocr",
-        description="OCR engine: paddleocr, tesseract, ensemble",
-    ),
-    translation_model: str = Query(
-        default="facebook/nllb-200-3.3B",
-        description="Translation model identifier",
-    ),
-    db: Session = Depends(get_db),
-):
-    """Create a new job for document processing."""
-    # Validate file type
+def _validate_upload(file: UploadFile) -> None:
+    """Reject uploads with a disallowed type or an oversized parsed size."""
     if not is_allowed_file_type(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type not allowed. Allowed types: {', '.join(settings.allowed_file_extensions)}",
+            detail=f"File type not allowed. Allowed types: {_ALLOWED_EXTENSIONS_DISPLAY}",
         )
 
-    # Read file content
-    file_content = await file.read()
-    file_size = len(file_content)
-
-    # Validate file size
-    if file_size > settings.max_file_size_bytes:
+    # Reject on the parsed upload size before copying anything
+    if file.size is not None and file.size > settings.max_file_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File size exceeds maximum of {settings.max_file_size_mb}MB",
         )
 
-    # Save file
+
+async def _save_upload(file: UploadFile) -> Tuple[Path, int]:
+    """Stream an upload to disk off the event loop, enforcing the size limit as we go."""
     try:
-        file_path, unique_filename = save_uploaded_file(file_content, file.filename)
+        file_path, _, file_size = await run_in_threadpool(
+            save_uploaded_file,
+            file.file,
+            file.filename,
+            settings.max_file_size_bytes,
+        )
+    except FileTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds maximum of {settings.max_file_size_mb}MB",
+        )
     except Exception as e:
         logger.error(f"Error saving file: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save uploaded file",
         )
+    return file_path, file_size
+
 
-    # Determine file type
-    file_ext = Path(file.filename).suffix.lower()
+def _get_file_type(filename: str) -> str:
+    """Map an upload filename to the job file type."""
+    file_ext = Path(filename).suffix.lower()
     if file_ext == ".pdf":
-        file_type = "pdf"
+        return "pdf"
     elif file_ext == ".docx":
-        file_type = "docx"
-    else:
-        file_type = "image"
+        return "docx"
+    return "image"
+
+
+@router.post("/jobs", response_model=JobCreateResponse, status_code=status.HTTP_201_CREATED)
+async def create_job(
+    file: UploadFile = File(...),
+    source_language: str = Query(default="ar", description="Source language code"),
+    target_language: str = Query(default="en", description="Target language code"),
+    preserve_layout: bool = Query(default=True, description="Preserve document layout"),
+    ocr_engine: str = Query(
+        default="paddleocr",
+        description="OCR engine: paddleocr, tesseract, ensemble",
+    ),
+    translation_model: str = Query(
+        default="facebook/nllb-200-3.3B",
+        description="Translation model identifier",
+    ),
+    db: Session = Depends(get_db),
+):
+    """Create a new job for document processing."""
+    _validate_upload(file)
+    file_path, file_size = await _save_upload(file)
 
     # Create job record
     job = Job(
@@ -163,7 +177,7 @@ async def create_job(
         original_filename=file.filename,
         file_path=str(file_path),
         file_size=file_size,
-        file_type=file_type,
+        file_type=_get_file_type(file.filename),
         config={
             "source_language": source_language,
             "target_language": target_language,
@@ -182,7 +196,10 @@ async def create_job(
         if settings.celery_broker_url.startswith("memory://"):
             process_document_task.apply(args=[str(job.id)])
         else:
-            process_document_task.delay(str(job.id))
+            process_document_task.apply_async(
+                args=[str(job.id)],
+                queue=settings.celery_queue,
+            )
         logger.info(f"Job {job.id} queued for processing")
     except Exception as e:
         logger.error(f"Error enqueueing job {job.id}: {e}")
@@ -201,35 +218,138 @@ async def create_job(
     )
 
 
-@router.get("/jobs/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str, db: Session = Depends(get_db)):
-    """Get job status and metadata."""
-    try:
-        job_uuid = UUID(job_id)
-    except ValueError:
+@router.post(
+    "/jobs/bulk",
+    response_model=JobBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_jobs_bulk(
+    files: List[UploadFile] = File(...),
+    source_language: str = Query(default="ar", description="Source language code"),
+    target_language: str = Query(default="en", description="Target language code"),
+    preserve_layout: bool = Query(default=True, description="Preserve document layout"),
+    ocr_engine: str = Query(
+        default="paddleocr",
+        description="OCR engine: paddleocr, tesseract, ensemble",
+    ),
+    translation_model: str = Query(
+        default="facebook/nllb-200-3.3B",
+        description="Translation model identifier",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Create one job per uploaded file in a single request.
+
+    All files are validated before any is saved, job rows are inserted in one
+    transaction, and tasks are published over a single broker connection.
+    """
+    if len(files) > settings.max_bulk_files:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid job ID format",
+            detail=f"At most {settings.max_bulk_files} files can be uploaded at once",
         )
+    for file in files:
+        _validate_upload(file)
 
-    job = db.query(Job).filter(Job.id == job_uuid).first()
-    if not job:
+    saved_paths = []
+    try:
+        for file in files:
+            saved_paths.append(await _save_upload(file))
+    except HTTPException:
+        for file_path, _ in saved_paths:
+            file_path.unlink(missing_ok=True)
+        raise
+
+    config = {
+        "source_language": source_language,
+        "target_language": target_language,
+        "preserve_layout": preserve_layout,
+        "ocr_engine": ocr_engine,
+        "translation_model": translation_model,
+    }
+    created_at = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid4()),
+            "status": JobStatus.QUEUED,
+            "original_filename": file.filename,
+            "file_path": str(file_path),
+            "file_size": file_size,
+            "file_type": _get_file_type(file.filename),
+            "config": config,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+        for file, (file_path, file_size) in zip(files, saved_paths)
+    ]
+    job_ids = [row["id"] for row in rows]
+
+    db.bulk_insert_mappings(Job, rows)
+    db.commit()
+
+    # Enqueue processing tasks. For local in-memory broker, run synchronously.
+    enqueued = 0
+    try:
+        if settings.celery_broker_url.startswith("memory://"):
+            for job_id in job_ids:
+                process_document_task.apply(args=[job_id])
+                enqueued += 1
+        else:
+            with process_document_task.app.producer_or_acquire() as producer:
+                for job_id in job_ids:
+                    process_document_task.apply_async(
+                        args=[job_id],
+                        queue=settings.celery_queue,
+                        producer=producer,
+                    )
+                    enqueued += 1
+        logger.info(f"{len(job_ids)} jobs queued for processing")
+    except Exception as e:
+        logger.error(f"Error enqueueing bulk jobs: {e}")
+        db.query(Job).filter(Job.id.in_(job_ids[enqueued:])).update(
+            {
+                Job.status: JobStatus.FAILED,
+                Job.error_message: f"Failed to enqueue task: {str(e)}",
+            },
+            synchronize_session=False,
+        )
+        db.commit()
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to enqueue processing tasks",
         )
 
+    return JobBulkCreateResponse(
+        jobs=[
+            JobCreateResponse(
+                job_id=job_id,
+                status=JobStatus.QUEUED.value,
+                created_at=created_at,
+            )
+            for job_id in job_ids
+        ]
+    )
+
+
+def _build_job_response(job: Job) -> JobResponse:
+    """
+    Build a JobResponse from a Job row without re-validating.
+
+    Rows were validated on the way in, so model_construct skips Pydantic
+    validation for the response models.
+    """
     stats = None
     if job.stats:
-        stats = JobStats(**job.stats)
+        stats = JobStats.model_construct(**job.stats)
 
-    processing_stages = ProcessingStages(
+    processing_stages = ProcessingStages.model_construct(
         extraction=job.extraction_stage.value,
         ocr=job.ocr_stage.value,
         translation=job.translation_stage.value,
     )
 
-    return JobResponse(
+    return JobResponse.model_construct(
         job_id=str(job.id),
         status=job.status.value,
         original_filename=job.original_filename,
@@ -241,6 +361,37 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
     )
 
 
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, db: Session = Depends(get_db)):
+    """Get job status and metadata."""
+    try:
+        job_uuid = UUID(job_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid job ID format",
+        )
+
+    cached = job_cache.get_cached_job(str(job_uuid))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    job = db.get(Job, str(job_uuid))
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    payload = _build_job_response(job).model_dump_json().encode("utf-8")
+    job_cache.cache_job(
+        str(job_uuid),
+        payload,
+        terminal=job.status in (JobStatus.COMPLETED, JobStatus.FAILED),
+    )
+    return Response(content=payload, media_type="application/json")
+
+
 @router.get("/jobs/{job_id}/result", response_model=JobResultResponse)
 async def get_job_result(job_id: str, db: Session = Depends(get_db)):
     """Get job results (Arabic and English structured documents)."""
@@ -252,7 +403,11 @@ async def get_job_result(job_id: str, db: Session = Depends(get_db)):
             detail="Invalid job ID format",
         )
 
-    job = db.query(Job).filter(Job.id == job_uuid).first()
+    cached = job_cache.get_cached_result(str(job_uuid))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    job = db.get(Job, str(job_uuid), options=[undefer_group("results")])
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -265,19 +420,50 @@ async def get_job_result(job_id: str, db: Session = Depends(get_db)):
             detail=f"Job is not completed. Current status: {job.status.value}",
         )
 
-    arabic_doc = None
-    english_doc = None
+    # Stored documents were validated when the job completed; serialize the
+    # dicts directly instead of rebuilding every Page and Block model
+    payload = orjson.dumps(
+        {
+            "job_id": str(job.id),
+            "arabic": job.arabic_json or None,
+            "english": job.english_json or None,
+        }
+    )
+    job_cache.cache_result(str(job_uuid), payload)
+    return Response(content=payload, media_type="application/json")
+
 
-    if job.arabic_json:
-        arabic_doc = StructuredDocument(**job.arabic_json)
-    if job.english_json:
-        english_doc = StructuredDocument(**job.english_json)
+def _content_disposition(filename: str) -> str:
+    """Build an attachment Content-Disposition header, as FileResponse does."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
 
-    return JobResultResponse(
-        job_id=str(job.id),
-        arabic=arabic_doc,
-        english=english_doc,
-    )
+
+# Completed results never change, so generated downloads can be cached freely
+_DOWNLOAD_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600, immutable"}
+
+_DOWNLOAD_MEDIA_TYPES = {
+    "json": "application/json",
+    "txt": "text/plain",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+_DOWNLOAD_GENERATORS = {
+    "txt": generate_txt_from_document,
+    "docx": generate_docx_from_document,
+}
+
+
+def _generate_download(generator, doc_data: dict, output_path: Path) -> None:
+    """Generate a download file atomically so concurrent readers never see a partial file."""
+    temp_path = output_path.with_name(f"{output_path.name}.{uuid4().hex}.tmp")
+    try:
+        generator(StructuredDocument(**doc_data), temp_path)
+        temp_path.replace(output_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
 
 
 @router.get("/jobs/{job_id}/download")
@@ -287,7 +473,12 @@ async def download_job_result(
     format: str = Query(default="json", description="Format: json, txt, or docx"),
     db: Session = Depends(get_db),
 ):
-    """Download job result in specified format."""
+    """
+    Download job result in specified format.
+
+    Result files are served straight from disk; the result documents are only
+    loaded from the database when a file is missing.
+    """
     try:
         job_uuid = UUID(job_id)
     except ValueError:
@@ -296,7 +487,7 @@ async def download_job_result(
             detail="Invalid job ID format",
         )
 
-    job = db.query(Job).filter(Job.id == job_uuid).first()
+    job = db.get(Job, str(job_uuid))
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -309,12 +500,12 @@ async def download_job_result(
             detail=f"Job is not completed. Current status: {job.status.value}",
         )
 
-    # Get document
+    # Get document column
     if language == "ar":
-        doc_data = job.arabic_json
+        doc_column = "arabic_json"
         lang_suffix = "arabic"
     elif language == "en":
-        doc_data = job.english_json
+        doc_column = "english_json"
         lang_suffix = "english"
     else:
         raise HTTPException(
@@ -322,52 +513,71 @@ async def download_job_result(
             detail="Language must be 'ar' or 'en'",
         )
 
-    if not doc_data:
+    def load_document() -> dict:
+        """Load the requested result document (deferred column), or 404."""
+        doc_data = getattr(job, doc_column)
+        if not doc_data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{language.upper()} document not found",
+            )
+        return doc_data
+
+    if format not in _DOWNLOAD_MEDIA_TYPES:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{language.upper()} document not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Format must be 'json', 'txt', or 'docx'",
         )
 
-    document = StructuredDocument(**doc_data)
-
-    # Generate file based on format
-    output_dir = Path(settings.upload_dir) / "downloads"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    if format == "json":
-        import json
+    download_filename = f"{job.original_filename}_{lang_suffix}.{format}"
+    output_path = get_results_dir(str(job_uuid)) / f"{lang_suffix}.{format}"
+
+    # Result files are normally written when the job completes; generate them
+    # here only for jobs that finished without them
+    if not output_path.exists():
+        if format == "json":
+            # Stored results are already plain dicts; serialize them in one pass
+            return Response(
+                content=orjson.dumps(load_document(), option=orjson.OPT_INDENT_2),
+                media_type=_DOWNLOAD_MEDIA_TYPES[format],
+                headers={
+                    "Content-Disposition": _content_disposition(download_filename),
+                    **_DOWNLOAD_CACHE_HEADERS,
+                },
+            )
 
-        output_path = output_dir / f"{job_id}_{lang_suffix}.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(document.dict(), f, ensure_ascii=False, indent=2)
-        return FileResponse(
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        await run_in_threadpool(
+            _generate_download,
+            _DOWNLOAD_GENERATORS[format],
+            load_document(),
             output_path,
-            media_type="application/json",
-            filename=f"{job.original_filename}_{lang_suffix}.json",
         )
 
-    elif format == "txt":
-        output_path = output_dir / f"{job_id}_{lang_suffix}.txt"
-        generate_txt_from_document(document, output_path)
-        return FileResponse(
-            output_path,
-            media_type="text/plain",
-            filename=f"{job.original_filename}_{lang_suffix}.txt",
-        )
+    return FileResponse(
+        output_path,
+        media_type=_DOWNLOAD_MEDIA_TYPES[format],
+        filename=download_filename,
+        headers=_DOWNLOAD_CACHE_HEADERS,
+    )
 
-    elif format == "docx":
-        output_path = output_dir / f"{job_id}_{lang_suffix}.docx"
-        generate_docx_from_document(document, output_path)
-        return FileResponse(
-            output_path,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"{job.original_filename}_{lang_suffix}.docx",
-        )
 
-    else:
+def _encode_cursor(created_at: datetime, job_id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor token."""
+    raw = f"{created_at.isoformat()}|{job_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor token produced by `_encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, job_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), job_id
+    except (ValueError, UnicodeError):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Format must be 'json', 'txt', or 'docx'",
+            detail="Invalid cursor",
         )
 
 
@@ -376,10 +586,20 @@ async def list_jobs(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     status_filter: Optional[str] = Query(default=None, alias="status"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Keyset cursor from a previous response; takes precedence over page",
+    ),
     db: Session = Depends(get_db),
 ):
-    """List all jobs with pagination."""
-    query = db.query(Job)
+    """
+    List all jobs with pagination.
+
+    The total is computed with a window function alongside the page rows, so
+    listing costs a single round-trip. When a cursor is given, pagination is
+    keyset-based and the total counts the jobs remaining after the cursor.
+    """
+    query = db.query(Job, func.count().over().label("total"))
 
     # Apply status filter
     if status_filter:
@@ -392,44 +612,43 @@ async def list_jobs(
                 detail=f"Invalid status: {status_filter}",
             )
 
-    # Get total count
-    total = query.count()
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(tuple_(Job.created_at, Job.id) < (cursor_created_at, cursor_id))
+        offset = 0
+    else:
+        offset = (page - 1) * page_size
 
     # Apply pagination
-    jobs = query.order_by(Job.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
-
-    # Convert to response format
-    job_responses = []
-    for job in jobs:
-        stats = None
-        if job.stats:
-            stats = JobStats(**job.stats)
-
-        processing_stages = ProcessingStages(
-            extraction=job.extraction_stage.value,
-            ocr=job.ocr_stage.value,
-            translation=job.translation_stage.value,
-        )
+    rows = (
+        query.order_by(Job.created_at.desc(), Job.id.desc())
+        .offset(offset)
+        .limit(page_size)
+        .all()
+    )
 
-        job_responses.append(
-            JobResponse(
-                job_id=str(job.id),
-                status=job.status.value,
-                original_filename=job.original_filename,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                stats=stats,
-                error_message=job.error_message,
-                processing_stages=processing_stages,
-            )
-        )
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Past the last page the window has no rows to report on
+        total = query.with_entities(func.count(Job.id)).scalar()
+    else:
+        total = 0
+
+    jobs = [row.Job for row in rows]
+
+    next_cursor = None
+    if len(jobs) == page_size:
+        next_cursor = _encode_cursor(jobs[-1].created_at, jobs[-1].id)
 
-    return JobListResponse(
-        jobs=job_responses,
+    list_response = JobListResponse.model_construct(
+        jobs=[_build_job_response(job) for job in jobs],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
+    return Response(content=list_response.model_dump_json(), media_type="application/json")
 
 
 @router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -443,7 +662,7 @@ async def delete_job(job_id: str, db: Session = Depends(get_db)):
             detail="Invalid job ID format",
         )
 
-    job = db.query(Job).filter(Job.id == job_uuid).first()
+    job = db.get(Job, str(job_uuid))
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -454,10 +673,12 @@ async def delete_job(job_id: str, db: Session = Depends(get_db)):
     file_path = Path(job.file_path)
     if file_path.exists():
         file_path.unlink()
+    shutil.rmtree(get_results_dir(str(job_uuid)), ignore_errors=True)
 
     # Delete job record
     db.delete(job)
     db.commit()
+    job_cache.invalidate_job(str(job_uuid))
 
     return None
 
@@ -1,8 +1,8 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
 
     # File Upload
     max_file_size_mb: int = Field(default=50, alias="MAX_FILE_SIZE_MB")
+    # Files accepted by one POST /api/jobs/bulk request
+    max_bulk_files: int = Field(default=20, alias="MAX_BULK_FILES")
     upload_dir: Path = Field(default=Path("/uploads"), alias="UPLOAD_DIR")
     model_path: Path = Field(default=Path("/models"), alias="MODEL_PATH")
 
@@ -42,6 +44,30 @@ class Settings(BaseSettings):
     ocr_engine: str = Field(default="paddleocr", alias="OCR_ENGINE")
     use_tesseract_fallback: bool = Field(default=True, alias="USE_TESSERACT_FALLBACK")
     tesseract_lang: str = Field(default="ara", alias="TESSERACT_LANG")
+    use_gpu: bool = Field(default=False, alias="USE_GPU")
+    gpu_mem: int = Field(default=500, alias="GPU_MEM")  # MB reserved by PaddleOCR
+    # Recognition batch size; defaults to 1 on CPU (larger batches only grow
+    # Paddle's memory arena there) and 6 on GPU
+    rec_batch_num: Optional[int] = Field(default=None, alias="REC_BATCH_NUM")
+    det_limit_side_len: int = Field(default=960, alias="DET_LIMIT_SIDE_LEN")
+    denoise_mode: Literal["none", "median", "bilateral", "nlmeans"] = Field(
+        default="median",
+        alias="DENOISE_MODE",
+    )
+    # OCR worker processes per job; 0 or 1 runs OCR in the calling process
+    ocr_workers: int = Field(default=0, alias="OCR_WORKERS")
+    # Processes for reading the text layer of large PDFs; 0 or 1 reads in-process
+    pdf_workers: int = Field(default=0, alias="PDF_WORKERS")
+    # Reuse OCR results for pages whose pixels were already recognized
+    use_ocr_cache: bool = Field(default=True, alias="USE_OCR_CACHE")
+    # Least recently used entries are pruned after each job beyond this size
+    ocr_cache_max_mb: int = Field(default=512, alias="OCR_CACHE_MAX_MB")
+    # Unix socket of the shared PaddleOCR daemon (app.services.ocr_daemon);
+    # unset loads PaddleOCR in each worker process instead. The daemon runs
+    # one request at a time, so it only pays off when model memory or load
+    # time dominates; with several busy workers it caps OCR throughput at
+    # that of a single engine
+    ocr_daemon_socket: Optional[str] = Field(default=None, alias="OCR_DAEMON_SOCKET")
 
     # Translation Configuration
     translation_model: str = Field(
@@ -61,26 +87,38 @@ class Settings(BaseSettings):
         default="file:///tmp/celeryresults",
         alias="CELERY_RESULT_BACKEND",
     )
+    # Dedicated queue for the long-running document pipeline
+    celery_queue: str = Field(default="ocr_cpu", alias="CELERY_QUEUE")
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
-    def __init__(self, **kwargs):
-        """Initialize settings and create directories."""
-        super().__init__(**kwargs)
-        # Ensure directories exist
+    def ensure_dirs(self) -> None:
+        """Create upload and model directories. Called once at process startup."""
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self.model_path.mkdir(parents=True, exist_ok=True)
 
-    @property
+    @cached_property
+    def effective_rec_batch_num(self) -> int:
+        """Get the PaddleOCR recognition batch size for the configured device."""
+        if self.rec_batch_num is not None:
+            return self.rec_batch_num
+        return 6 if self.use_gpu else 1
+
+    @cached_property
     def max_file_size_bytes(self) -> int:
         """Get max file size in bytes."""
-        return self.max_file_size_mb * 1024 * 1024
+        return self.max_file_size_mb << 20
+
+    @cached_property
+    def ocr_cache_max_bytes(self) -> int:
+        """Get the OCR cache size limit in bytes."""
+        return self.ocr_cache_max_mb << 20
 
-    @property
-    def allowed_file_extensions(self) -> List[str]:
+    @cached_property
+    def allowed_file_extensions(self) -> FrozenSet[str]:
         """Get allowed file extensions."""
-        return [".pdf", ".docx", ".jpg", ".jpeg", ".png", ".tiff", ".tif"]
+        return frozenset({".pdf", ".docx", ".jpg", ".jpeg", ".png", ".tiff", ".tif"})
 
 
 @lru_cache()
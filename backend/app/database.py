@@ -1,5 +1,6 @@
 """Database connection and session management."""
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -8,11 +9,19 @@ from app.config import get_settings
 
 settings = get_settings()
 
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson; result documents are large."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
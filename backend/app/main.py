@@ -3,12 +3,14 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router
 from app.config import get_settings
 from app.database import Base, engine
+from app.redis_client import pool as redis_pool
 
 # Configure logging
 logging.basicConfig(
@@ -25,14 +27,17 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown."""
     # Startup
     logger.info("Starting application...")
+    settings.ensure_dirs()
     # Create database tables
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created/verified")
+    app.state.redis_pool = redis_pool
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    redis_pool.disconnect()
 
 
 # Create FastAPI app
@@ -41,6 +46,7 @@ app = FastAPI(
     description="Production-ready API for Arabic text extraction and translation",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -52,6 +58,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Allowance for multipart framing and form fields on top of the file itself
+MAX_REQUEST_OVERHEAD_BYTES = 64 * 1024
+
+BULK_UPLOAD_PATH = "/api/jobs/bulk"
+
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Reject oversized requests from Content-Length before the body is read."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        max_request_size = settings.max_file_size_bytes + MAX_REQUEST_OVERHEAD_BYTES
+        # Bulk uploads carry several files; each is still checked against
+        # max_file_size_bytes while it is streamed to disk
+        if request.url.path == BULK_UPLOAD_PATH:
+            max_request_size *= settings.max_bulk_files
+        if int(content_length) > max_request_size:
+            return ORJSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={
+                    "detail": f"File size exceeds maximum of {settings.max_file_size_mb}MB"
+                },
+            )
+    return await call_next(request)
+
+
 # Include routers
 app.include_router(router)
 
@@ -5,7 +5,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import deferred
+from sqlalchemy.types import TypeDecorator
 
 from app.database import Base
 
@@ -31,6 +33,33 @@ class ProcessingStage(str, Enum):
     FAILED = "failed"
 
 
+class StringEnum(TypeDecorator):
+    """Store a str-based Enum as its plain string value in a VARCHAR column."""
+
+    impl = String(50)
+    cache_ok = True
+
+    def __init__(self, enum_class, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        """Convert an enum member (or its value) to the stored string."""
+        if value is None:
+            return None
+        return self.enum_class(value).value
+
+    def process_result_value(self, value, dialect):
+        """Convert a stored string back to an enum member."""
+        if value is None:
+            return None
+        try:
+            return self.enum_class(value)
+        except ValueError:
+            # Rows written by the former SQLEnum columns hold member names
+            return self.enum_class[value]
+
+
 class Job(Base):
     """Job model for tracking document processing."""
 
@@ -38,7 +67,7 @@ class Job(Base):
 
     # Use string UUID for SQLite compatibility
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    status = Column(SQLEnum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    status = Column(StringEnum(JobStatus), default=JobStatus.QUEUED, nullable=False, index=True)
     original_filename = Column(String(255), nullable=False)
     file_path = Column(String(512), nullable=False)
     file_size = Column(Integer, nullable=False)
@@ -46,17 +75,17 @@ class Job(Base):
 
     # Processing stages
     extraction_stage = Column(
-        SQLEnum(ProcessingStage),
+        StringEnum(ProcessingStage),
         default=ProcessingStage.PENDING,
         nullable=False,
     )
     ocr_stage = Column(
-        SQLEnum(ProcessingStage),
+        StringEnum(ProcessingStage),
         default=ProcessingStage.PENDING,
         nullable=False,
     )
     translation_stage = Column(
-        SQLEnum(ProcessingStage),
+        StringEnum(ProcessingStage),
         default=ProcessingStage.PENDING,
         nullable=False,
     )
@@ -64,23 +93,32 @@ class Job(Base):
     # Results storage (JSON paths or direct JSON)
     arabic_json_path = Column(String(512), nullable=True)
     english_json_path = Column(String(512), nullable=True)
-    arabic_json = Column(JSON, nullable=True)  # Store structured Arabic text
-    english_json = Column(JSON, nullable=True)  # Store structured English translation
+    # Large result documents are deferred so status/list queries don't load them;
+    # use undefer_group("results") when the documents are needed
+    arabic_json = deferred(Column(JSON, nullable=True), group="results")  # Structured Arabic text
+    english_json = deferred(Column(JSON, nullable=True), group="results")  # English translation
 
     # Statistics
     stats = Column(JSON, nullable=True)  # Total pages, blocks, characters, etc.
 
     # Error handling
     error_message = Column(Text, nullable=True)
-    error_traceback = Column(Text, nullable=True)
+    error_traceback = deferred(Column(Text, nullable=True))
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
 
     # Configuration used for this job
-    config = Column(JSON, nullable=True)  # OCR engine, translation model, etc.
+    config = deferred(Column(JSON, nullable=True))  # OCR engine, translation model, etc.
+
+    __table_args__ = (
+        # Backs the keyset ordering used when listing jobs
+        Index("ix_jobs_created_at_id", created_at.desc(), id.desc()),
+        # Backs status-filtered listings ordered by recency
+        Index("ix_jobs_status_created_at", status, created_at.desc()),
+    )
 
     def __repr__(self) -> str:
         """String representation."""
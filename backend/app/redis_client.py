@@ -0,0 +1,15 @@
+"""Shared Redis connection pool."""
+
+import redis
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# One pool per process; connections are opened lazily and reused across requests
+pool = redis.ConnectionPool.from_url(settings.redis_url, max_connections=32)
+
+
+def get_redis() -> redis.Redis:
+    """Get a Redis client backed by the shared connection pool."""
+    return redis.Redis(connection_pool=pool)
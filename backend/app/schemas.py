@@ -108,6 +108,12 @@ class JobCreateResponse(BaseModel):
     created_at: datetime
 
 
+class JobBulkCreateResponse(BaseModel):
+    """Bulk job creation response schema."""
+
+    jobs: List[JobCreateResponse]
+
+
 class JobStats(BaseModel):
     """Job statistics."""
 
@@ -163,6 +169,7 @@ class JobListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -12,6 +12,13 @@ from app.schemas import Block, StructuredDocument
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for TXT output
+TXT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Prebuilt TXT line prefixes for common heading and list levels
+_HEADING_PREFIXES = {level: "#" * level + " " for level in range(1, 10)}
+_LIST_PREFIXES = {level: "  " * level + "- " for level in range(10)}
+
 
 def generate_docx_from_document(
     document: StructuredDocument,
@@ -39,47 +46,66 @@ def generate_docx_from_document(
     font.name = "Arial"
     font.size = Pt(12)
 
+    # Resolve styles, enum values and bound methods once, not per block
+    is_arabic = document.language == "ar"
+    align_right = WD_ALIGN_PARAGRAPH.RIGHT
+    add_paragraph = doc.add_paragraph
+    list_style = doc.styles["List Bullet"]
+    heading_styles = {level: doc.styles[f"Heading {level}"] for level in range(1, 10)}
+
+    last_page_index = len(document.pages) - 1
+
     for page in document.pages:
         for block in page.blocks:
-            if not block.text.strip():
+            text = block.text
+            if not text.strip():
                 continue
 
             if preserve_structure:
+                # Read block fields once and branch on locals
+                block_type = block.type
+                metadata = block.metadata
+                list_level = metadata.list_level
+                table = metadata.table
+
                 # Handle different block types
-                if block.type == "heading" and block.metadata.is_heading:
+                if block_type == "heading" and metadata.is_heading:
                     # Add heading
-                    level = block.metadata.heading_level or 1
-                    heading = doc.add_heading(block.text, level=level)
+                    level = metadata.heading_level or 1
+                    heading_style = heading_styles.get(level)
+                    if heading_style is not None:
+                        heading = add_paragraph(text, heading_style)
+                    else:
+                        heading = doc.add_heading(text, level=level)
                     # Set RTL for Arabic if needed
-                    if document.language == "ar":
-                        paragraph_format = heading.paragraph_format
-                        paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+                    if is_arabic:
+                        heading.paragraph_format.alignment = align_right
 
-                elif block.type == "table_cell" and block.metadata.table:
+                elif block_type == "table_cell" and table:
                     # Handle tables - this is simplified
                     # In a full implementation, you'd need to reconstruct table structure
                     # For now, we'll add table cells as paragraphs with indentation
-                    para = doc.add_paragraph(block.text)
-                    if block.metadata.table.col:
-                        para.paragraph_format.left_indent = Inches(block.metadata.table.col * 0.5)
+                    para = add_paragraph(text)
+                    if table.col:
+                        para.paragraph_format.left_indent = Inches(table.col * 0.5)
 
-                elif block.metadata.list_level is not None:
+                elif list_level is not None:
                     # Add list item
-                    para = doc.add_paragraph(block.text, style="List Bullet")
-                    para.paragraph_format.left_indent = Inches(block.metadata.list_level * 0.5)
+                    para = add_paragraph(text, list_style)
+                    para.paragraph_format.left_indent = Inches(list_level * 0.5)
 
                 else:
                     # Regular paragraph
-                    para = doc.add_paragraph(block.text)
+                    para = add_paragraph(text)
                     # Set RTL for Arabic
-                    if document.language == "ar":
-                        para.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+                    if is_arabic:
+                        para.paragraph_format.alignment = align_right
             else:
                 # Simple mode: just add paragraphs
-                doc.add_paragraph(block.text)
+                add_paragraph(text)
 
         # Add page break between pages (except last)
-        if page.page_index < len(document.pages) - 1:
+        if page.page_index < last_page_index:
             doc.add_page_break()
 
     # Save document
@@ -108,36 +134,39 @@ def generate_txt_from_document(
     """
     logger.info(f"Generating TXT from document: {output_path}")
 
-    lines = []
+    # Write lines as they are produced instead of joining the whole text first
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8", buffering=TXT_WRITE_BUFFER_SIZE) as f:
+        for line_index, line in enumerate(_iter_txt_lines(document, preserve_structure)):
+            if line_index:
+                f.write("\n")
+            f.write(line)
+
+    logger.info(f"TXT generated successfully: {output_path}")
+    return output_path
+
 
+def _iter_txt_lines(document: StructuredDocument, preserve_structure: bool) -> Iterator[str]:
+    """Yield the plain text lines for a document (see `generate_txt_from_document`)."""
     for page in document.pages:
         for block in page.blocks:
-            if not block.text.strip():
+            text = block.text
+            if not text.strip():
                 continue
 
             if preserve_structure:
-                if block.type == "heading" and block.metadata.is_heading:
-                    level = block.metadata.heading_level or 1
-                    prefix = "#" * level + " "
-                    lines.append(f"{prefix}{block.text}")
-                elif block.metadata.list_level is not None:
-                    prefix = "  " * block.metadata.list_level + "- "
-                    lines.append(f"{prefix}{block.text}")
+                metadata = block.metadata
+                list_level = metadata.list_level
+                if block.type == "heading" and metadata.is_heading:
+                    level = metadata.heading_level or 1
+                    prefix = _HEADING_PREFIXES.get(level) or "#" * level + " "
+                    yield prefix + text
+                elif list_level is not None:
+                    prefix = _LIST_PREFIXES.get(list_level) or "  " * list_level + "- "
+                    yield prefix + text
                 else:
-                    lines.append(block.text)
+                    yield text
             else:
-                lines.append(block.text)
-
-        lines.append("")  # Blank line between pages
-
-    # Write to file
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
-    logger.info(f"TXT generated successfully: {output_path}")
-    return output_path
-
-
-
+                yield text
 
+        yield ""  # Blank line between pages
@@ -1,14 +1,26 @@
 """OCR service using PaddleOCR and Tesseract."""
 
+import hashlib
+import importlib.metadata
 import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from multiprocessing.connection import Client, Connection
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 
 import cv2
 import numpy as np
+import orjson
 from PIL import Image
 
 from app.config import get_settings
+from app.utils.file_handler import get_ocr_cache_dir
 from app.utils.layout_schema import create_block
 
 logger = logging.getLogger(__name__)
@@ -17,6 +29,25 @@ settings = get_settings()
 # Lazy loading of OCR engines
 _paddleocr_instance = None
 _tesseract_available = None
+_turbojpeg_instance = None
+_ocr_process_pool: Optional[ProcessPoolExecutor] = None
+_ocr_daemon_connection: Optional[Connection] = None
+_ocr_daemon_lock = threading.Lock()
+
+
+def _paddleocr_params() -> dict:
+    """Get the keyword arguments PaddleOCR is constructed with."""
+    return {
+        "use_angle_cls": True,
+        "lang": "ar",
+        "use_gpu": settings.use_gpu,
+        "gpu_mem": settings.gpu_mem,
+        "rec_batch_num": settings.effective_rec_batch_num,
+        "cls_batch_num": settings.effective_rec_batch_num,
+        "det_limit_side_len": settings.det_limit_side_len,
+        "enable_mkldnn": not settings.use_gpu,
+        "cpu_threads": max(2, (os.cpu_count() or 1) // 2),
+    }
 
 
 def _get_paddleocr():
@@ -26,12 +57,11 @@ def _get_paddleocr():
         try:
             from paddleocr import PaddleOCR
 
-            _paddleocr_instance = PaddleOCR(
-                use_angle_cls=True,
-                lang="ar",
-                use_gpu=False,  # Set to True if GPU available
-            )
-            logger.info("PaddleOCR initialized successfully")
+            _paddleocr_instance = PaddleOCR(**_paddleocr_params())
+            if settings.use_gpu:
+                # Warm up so cuDNN autotuning doesn't land on the first real page
+                _paddleocr_instance.ocr(np.zeros((640, 640, 3), dtype=np.uint8), cls=True)
+            logger.info(f"PaddleOCR initialized successfully (gpu={settings.use_gpu})")
         except Exception as e:
             logger.error(f"Failed to initialize PaddleOCR: {e}")
             raise
@@ -54,17 +84,121 @@ def _check_tesseract():
     return _tesseract_available
 
 
-def preprocess_image(image_path: Path) -> np.ndarray:
+def _get_turbojpeg():
+    """Get a TurboJPEG decoder, or None when PyTurboJPEG/libturbojpeg is missing."""
+    global _turbojpeg_instance
+    if _turbojpeg_instance is None:
+        try:
+            from turbojpeg import TurboJPEG
+
+            _turbojpeg_instance = TurboJPEG()
+            logger.info("TurboJPEG is available for JPEG decoding")
+        except Exception as e:
+            _turbojpeg_instance = False
+            logger.info(f"TurboJPEG is not available, decoding JPEGs with OpenCV: {e}")
+    return _turbojpeg_instance or None
+
+
+def _read_grayscale(image_path: Path) -> Optional[np.ndarray]:
+    """
+    Decode an image file to grayscale, or return None if it can't be read.
+
+    JPEGs go through TurboJPEG's SIMD decoder when it is installed. Files with
+    an EXIF rotation are left to OpenCV, which applies the orientation.
+    """
+    if image_path.suffix.lower() in (".jpg", ".jpeg"):
+        jpeg = _get_turbojpeg()
+        if jpeg is not None:
+            try:
+                from turbojpeg import TJPF_GRAY
+
+                with Image.open(image_path) as pil_img:
+                    orientation = pil_img.getexif().get(0x0112, 1)
+                if orientation == 1:
+                    gray = jpeg.decode(image_path.read_bytes(), pixel_format=TJPF_GRAY)
+                    return gray.reshape(gray.shape[:2])
+            except Exception as e:
+                logger.warning(f"TurboJPEG decode failed for {image_path}, using OpenCV: {e}")
+
+    # Decode straight to grayscale rather than to BGR followed by a conversion
+    return cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+
+
+# Where a page image came from: "scan" for scans and photos, "digital" for
+# noise-free renders of digital content (e.g. a rasterized vector page)
+ImageSource = Literal["digital", "scan"]
+
+
+def preprocess_image(image_path: Path, source: ImageSource = "scan") -> np.ndarray:
     """
     Preprocess image for better OCR results.
     - Convert to grayscale
     - Apply denoising
     - Optional: deskew, binarization
     """
-    img = cv2.imread(str(image_path))
+    img = _read_grayscale(image_path)
     if img is None:
         raise ValueError(f"Could not read image: {image_path}")
 
+    return preprocess_array(img, source)
+
+
+def denoise(
+    gray: np.ndarray,
+    mode: Optional[str] = None,
+    source: ImageSource = "scan",
+) -> np.ndarray:
+    """
+    Denoise a grayscale image.
+
+    Args:
+        gray: Grayscale image
+        mode: 'none', 'median', 'bilateral' or 'nlmeans'; defaults to
+            ``settings.denoise_mode``. NLMeans is far slower than the others
+            and rarely improves recognition.
+        source: 'digital' renders have no noise and are returned unchanged
+
+    Returns:
+        Denoised image
+    """
+    mode = mode or settings.denoise_mode
+    if mode == "none" or source == "digital":
+        return gray
+
+    # Already-binary scans (e.g. fax/bilevel TIFF) have no noise to smooth
+    if len(np.unique(gray[::8, ::8])) <= 2:
+        return gray
+
+    if mode == "median":
+        return cv2.medianBlur(gray, 3)
+    if mode == "bilateral":
+        return cv2.bilateralFilter(gray, 5, 50, 50)
+    if mode == "nlmeans":
+        return cv2.fastNlMeansDenoising(gray, h=10)
+    raise ValueError(f"Unknown denoise mode: {mode}")
+
+
+def read_image_frames(image_path: Path) -> List[np.ndarray]:
+    """
+    Decode every frame of an image file as grayscale.
+
+    Multi-page TIFFs yield one array per page; other formats yield one.
+    """
+    frames: List[np.ndarray] = []
+    if image_path.suffix.lower() in (".tif", ".tiff"):
+        ok, decoded = cv2.imreadmulti(str(image_path), flags=cv2.IMREAD_GRAYSCALE)
+        if ok:
+            frames = list(decoded)
+    if not frames:
+        img = _read_grayscale(image_path)
+        if img is None:
+            raise ValueError(f"Could not read image: {image_path}")
+        frames = [img]
+    return frames
+
+
+def preprocess_array(img: np.ndarray, source: ImageSource = "scan") -> np.ndarray:
+    """Preprocess an already-decoded BGR or grayscale image (see `preprocess_image`)."""
     # Convert to grayscale
     if len(img.shape) == 3:
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
@@ -72,7 +206,7 @@ def preprocess_image(image_path: Path) -> np.ndarray:
         gray = img
 
     # Denoise
-    denoised = cv2.fastNlMeansDenoising(gray, h=10)
+    denoised = denoise(gray, source=source)
 
     # Optional: Adaptive thresholding for better contrast
     # binary = cv2.adaptiveThreshold(denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
@@ -81,41 +215,98 @@ def preprocess_image(image_path: Path) -> np.ndarray:
     return denoised
 
 
-def ocr_with_paddleocr(image_path: Path) -> List[Tuple[str, float, List[float]]]:
+def ocr_with_paddleocr(
+    image: Union[Path, np.ndarray],
+) -> List[Tuple[str, float, List[float]]]:
     """
     Run OCR using PaddleOCR.
 
+    Args:
+        image: Path to an image file, or an already-decoded image array
+
     Returns:
         List of tuples: (text, confidence, bbox)
         bbox format: [x1, y1, x2, y2]
     """
     try:
-        ocr = _get_paddleocr()
-        result = ocr.ocr(str(image_path), cls=True)
-
-        if not result or not result[0]:
-            return []
-
-        ocr_results = []
-        for line in result[0]:
-            if line:
-                bbox, (text, confidence) = line
-                # Convert bbox from [[x1,y1], [x2,y2], [x3,y3], [x4,y4]] to [x1, y1, x2, y2]
-                x_coords = [point[0] for point in bbox]
-                y_coords = [point[1] for point in bbox]
-                bbox_flat = [min(x_coords), min(y_coords), max(x_coords), max(y_coords)]
-                ocr_results.append((text, confidence, bbox_flat))
-
-        return ocr_results
+        if settings.ocr_daemon_socket:
+            return _ocr_via_daemon(image)
+        return run_paddleocr(image)
     except Exception as e:
         logger.error(f"PaddleOCR error: {e}")
         return []
 
 
-def ocr_with_tesseract(image_path: Path) -> List[Tuple[str, float, List[float]]]:
+def run_paddleocr(image: Union[Path, np.ndarray]) -> List[Tuple[str, float, List[float]]]:
+    """Run PaddleOCR in this process (see `ocr_with_paddleocr`); errors propagate."""
+    ocr = _get_paddleocr()
+    result = ocr.ocr(image if isinstance(image, np.ndarray) else str(image), cls=True)
+
+    if not result or not result[0]:
+        return []
+
+    ocr_results = []
+    for line in result[0]:
+        if line:
+            bbox, (text, confidence) = line
+            # Convert bbox from [[x1,y1], [x2,y2], [x3,y3], [x4,y4]] to [x1, y1, x2, y2]
+            x_coords = [point[0] for point in bbox]
+            y_coords = [point[1] for point in bbox]
+            bbox_flat = [min(x_coords), min(y_coords), max(x_coords), max(y_coords)]
+            ocr_results.append((text, confidence, bbox_flat))
+
+    return ocr_results
+
+
+def _ocr_via_daemon(image: Union[Path, np.ndarray]) -> List[Tuple[str, float, List[float]]]:
+    """
+    Send one image to the OCR daemon and wait for its results.
+
+    Each process keeps one connection to the daemon; it is re-established once
+    if the daemon has restarted since the last request. Arrays are sent as a
+    small header followed by their raw pixel buffer, without copying or
+    pickling the pixels.
+    """
+    global _ocr_daemon_connection
+    pixels = None
+    if isinstance(image, np.ndarray):
+        image = np.ascontiguousarray(image)
+        request = ("array", image.shape, image.dtype.str)
+        pixels = image.data.cast("B")
+    else:
+        request = ("path", str(image))
+
+    with _ocr_daemon_lock:
+        for attempt in range(2):
+            try:
+                if _ocr_daemon_connection is None:
+                    _ocr_daemon_connection = Client(settings.ocr_daemon_socket, "AF_UNIX")
+                _ocr_daemon_connection.send(request)
+                if pixels is not None:
+                    _ocr_daemon_connection.send_bytes(pixels)
+                status, payload = _ocr_daemon_connection.recv()
+                break
+            except (OSError, EOFError):
+                if _ocr_daemon_connection is not None:
+                    _ocr_daemon_connection.close()
+                    _ocr_daemon_connection = None
+                if attempt:
+                    raise
+
+    if status != "ok":
+        raise RuntimeError(f"OCR daemon error: {payload}")
+    return payload
+
+
+def ocr_with_tesseract(
+    image: Union[Path, np.ndarray],
+) -> List[Tuple[str, float, List[float]]]:
     """
     Run OCR using Tesseract.
 
+    Args:
+        image: Path to an image file, or an already-decoded image array
+
     Returns:
         List of tuples: (text, confidence, bbox)
     """
@@ -124,9 +315,11 @@ def ocr_with_tesseract(image_path: Path) -> List[Tuple[str, float, List[float]]]
 
     try:
         import pytesseract
-        from PIL import Image
 
-        img = Image.open(image_path)
+        if isinstance(image, np.ndarray):
+            img = Image.fromarray(image)
+        else:
+            img = Image.open(image).convert("L")
         # Get detailed data including bounding boxes
         data = pytesseract.image_to_data(
             img, lang=settings.tesseract_lang, output_type=pytesseract.Output.DICT
@@ -170,150 +363,558 @@ def group_ocr_results_into_blocks(
     if not ocr_results:
         return []
 
-    blocks = []
-    current_block_text = []
-    current_block_confidences = []
-    current_block_bbox = None
-    block_id_counter = 0
+    y_threshold = 30  # Pixels - lines within this distance are in same paragraph
 
     # Simple grouping: lines close together belong to same paragraph
     # Sort by y-coordinate (top to bottom)
-    sorted_results = sorted(ocr_results, key=lambda x: x[2][1])  # Sort by y1
+    bboxes = np.asarray([r[2] for r in ocr_results], dtype=np.float64)
+    confidences = np.asarray([r[1] for r in ocr_results], dtype=np.float64)
+    order = np.argsort(bboxes[:, 1], kind="stable")
+    bboxes = bboxes[order]
+    confidences = confidences[order]
+
+    # A line starts a new paragraph when its top is at least y_threshold below
+    # the lowest bottom seen so far. Once a gap opens every later line is below
+    # it, so the running max over all lines equals the max within the block.
+    lowest_bottom = np.maximum.accumulate(bboxes[:, 3])
+    breaks = bboxes[1:, 1] - lowest_bottom[:-1] >= y_threshold
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    ends = np.append(starts[1:], len(order))
+
+    block_x1 = np.minimum.reduceat(bboxes[:, 0], starts)
+    block_y1 = np.minimum.reduceat(bboxes[:, 1], starts)
+    block_x2 = np.maximum.reduceat(bboxes[:, 2], starts)
+    block_y2 = np.maximum.reduceat(bboxes[:, 3], starts)
+    avg_confidences = np.add.reduceat(confidences, starts) / (ends - starts)
 
-    y_threshold = 30  # Pixels - lines within this distance are in same paragraph
-
-    for text, confidence, bbox in sorted_results:
-        if current_block_bbox is None:
-            # Start new block
-            current_block_text = [text]
-            current_block_confidences = [confidence]
-            current_block_bbox = bbox.copy()
-        else:
-            # Check if this line belongs to current block
-            prev_y2 = current_block_bbox[3]
-            curr_y1 = bbox[1]
-
-            if curr_y1 - prev_y2 < y_threshold:
-                # Same paragraph
-                current_block_text.append(text)
-                current_block_confidences.append(confidence)
-                # Expand bbox
-                current_block_bbox[0] = min(current_block_bbox[0], bbox[0])
-                current_block_bbox[1] = min(current_block_bbox[1], bbox[1])
-                current_block_bbox[2] = max(current_block_bbox[2], bbox[2])
-                current_block_bbox[3] = max(current_block_bbox[3], bbox[3])
-            else:
-                # New paragraph - save current block
-                block_text = " ".join(current_block_text)
-                avg_confidence = sum(current_block_confidences) / len(current_block_confidences)
-                block = create_block(
-                    block_id=f"{page_index}-{block_id_counter}",
-                    text=block_text,
-                    block_type="paragraph",
-                    bbox=current_block_bbox,
-                    confidence=avg_confidence,
-                )
-                blocks.append(block.dict())
-
-                # Start new block
-                current_block_text = [text]
-                current_block_confidences = [confidence]
-                current_block_bbox = bbox.copy()
-                block_id_counter += 1
-
-    # Don't forget the last block
-    if current_block_text:
-        block_text = " ".join(current_block_text)
-        avg_confidence = sum(current_block_confidences) / len(current_block_confidences)
+    blocks = []
+    for block_id_counter, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
         block = create_block(
             block_id=f"{page_index}-{block_id_counter}",
-            text=block_text,
+            text=" ".join(ocr_results[i][0] for i in order[start:end]),
             block_type="paragraph",
-            bbox=current_block_bbox,
-            confidence=avg_confidence,
+            bbox=[
+                float(block_x1[block_id_counter]),
+                float(block_y1[block_id_counter]),
+                float(block_x2[block_id_counter]),
+                float(block_y2[block_id_counter]),
+            ],
+            confidence=float(avg_confidences[block_id_counter]),
         )
         blocks.append(block.dict())
 
     return blocks
 
 
+def merge_ocr_results(
+    primary: List[Tuple[str, float, List[float]]],
+    secondary: List[Tuple[str, float, List[float]]],
+    iou_threshold: float = 0.5,
+) -> List[Tuple[str, float, List[float]]]:
+    """
+    Merge results from two OCR engines by box overlap.
+
+    Boxes from the two engines that overlap with IoU above the threshold are
+    treated as the same text and the longer reading is kept. Secondary boxes
+    that mostly lie inside a primary box (e.g. Tesseract words within a
+    PaddleOCR line) are dropped as duplicates; the rest are added.
+
+    Args:
+        primary: (text, confidence, bbox) results from the primary engine
+        secondary: (text, confidence, bbox) results from the secondary engine
+        iou_threshold: Minimum IoU for two boxes to be considered the same text
+
+    Returns:
+        Merged list of (text, confidence, bbox) tuples
+    """
+    if not primary or not secondary:
+        return list(primary or secondary)
+
+    a = np.asarray([r[2] for r in primary], dtype=np.float64)[:, None, :]
+    b = np.asarray([r[2] for r in secondary], dtype=np.float64)[None, :, :]
+
+    # Pairwise intersection areas, shape (len(primary), len(secondary))
+    inter_w = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    inter = inter_w * inter_h
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    iou = inter / np.maximum(area_a + area_b - inter, 1e-9)
+    covered = inter / np.maximum(area_b, 1e-9)
+
+    merged = list(primary)
+    best_match = iou.argmax(axis=0)
+    for j, result in enumerate(secondary):
+        i = best_match[j]
+        if iou[i, j] > iou_threshold:
+            # Same text region: prefer the longer reading
+            if len(result[0]) > len(merged[i][0]):
+                merged[i] = result
+        elif not (covered[:, j] > iou_threshold).any():
+            merged.append(result)
+    return merged
+
+
+def _run_ocr_engines(
+    image: Union[Path, np.ndarray],
+    engine: str,
+    use_fallback: bool,
+) -> List[Tuple[str, float, List[float]]]:
+    """Run the selected OCR engine(s), with fallback or ensemble merging."""
+    ocr_results = []
+
+    if engine == "paddleocr" or engine == "ensemble":
+        ocr_results = ocr_with_paddleocr(image)
+        logger.info(f"PaddleOCR found {len(ocr_results)} text regions")
+
+    # Tesseract runs as the engine itself, as the other half of the ensemble,
+    # or as a fallback only when PaddleOCR found nothing
+    run_tesseract = (
+        engine in ("tesseract", "ensemble")
+        or (not ocr_results and use_fallback and settings.use_tesseract_fallback)
+    )
+    if run_tesseract:
+        tesseract_results = ocr_with_tesseract(image)
+        logger.info(f"Tesseract found {len(tesseract_results)} text regions")
+
+        if engine == "ensemble":
+            ocr_results = merge_ocr_results(ocr_results, tesseract_results)
+        elif not ocr_results:
+            ocr_results = tesseract_results
+
+    return ocr_results
+
+
+def _package_version(name: str) -> str:
+    """Get an installed package's version, or "none" if it is not installed."""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "none"
+
+
+@lru_cache(maxsize=1)
+def _ocr_cache_config_key() -> bytes:
+    """
+    Describe everything besides the image that affects OCR output.
+
+    Part of every cache key, so changing the engine settings or upgrading an
+    engine stops earlier results from being served.
+    """
+    return orjson.dumps(
+        {
+            "paddleocr": _paddleocr_params(),
+            "paddleocr_version": _package_version("paddleocr"),
+            "use_tesseract_fallback": settings.use_tesseract_fallback,
+            "tesseract_lang": settings.tesseract_lang,
+            "pytesseract_version": _package_version("pytesseract"),
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+
+def _ocr_cache_path(image: np.ndarray, engine: str, use_fallback: bool) -> Path:
+    """Cache file for an image's OCR results, keyed by its pixels and the engine setup."""
+    digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+    digest.update(f"{image.shape}|{image.dtype}|{engine}|{use_fallback}|".encode())
+    digest.update(_ocr_cache_config_key())
+    return get_ocr_cache_dir() / f"{digest.hexdigest()}.json"
+
+
+def _read_ocr_cache(cache_path: Path) -> Optional[List[Tuple[str, float, List[float]]]]:
+    """Read cached OCR results; a missing or unreadable entry is a miss."""
+    try:
+        ocr_results = [tuple(result) for result in orjson.loads(cache_path.read_bytes())]
+        # Bump the mtime so pruning evicts the least recently used entries first
+        os.utime(cache_path)
+        return ocr_results
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable OCR cache entry {cache_path.name}: {e}")
+        return None
+
+
+def _write_ocr_cache(cache_path: Path, ocr_results: List[Tuple[str, float, List[float]]]) -> None:
+    """Store OCR results; failures are logged and ignored."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial entry
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(orjson.dumps(ocr_results, option=orjson.OPT_SERIALIZE_NUMPY))
+        temp_path.replace(cache_path)
+    except Exception as e:
+        logger.warning(f"Failed to write OCR cache entry {cache_path.name}: {e}")
+
+
+def prune_ocr_cache(max_bytes: Optional[int] = None) -> int:
+    """
+    Delete the least recently used OCR cache entries until the cache fits.
+
+    Args:
+        max_bytes: Size limit for the cache directory (defaults to OCR_CACHE_MAX_MB)
+
+    Returns:
+        Number of entries deleted
+    """
+    if max_bytes is None:
+        max_bytes = settings.ocr_cache_max_bytes
+
+    entries = []
+    total_size = 0
+    try:
+        with os.scandir(get_ocr_cache_dir()) as it:
+            for entry in it:
+                # Skip temp files that another process is still writing
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logger.warning(f"Failed to scan OCR cache: {e}")
+        return 0
+
+    deleted = 0
+    if total_size > max_bytes:
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total_size -= size
+            deleted += 1
+        logger.info(f"Pruned {deleted} OCR cache entries")
+    return deleted
+
+
+def _recognize(
+    image: Union[Path, np.ndarray],
+    page_index: int,
+    engine: str,
+    use_fallback: bool,
+) -> List[dict]:
+    """
+    Run the selected OCR engine(s) on a prepared image and group the results.
+
+    Args:
+        image: Preprocessed image array, or path to the original image
+        page_index: Page index for block IDs
+        engine: OCR engine to use ('paddleocr', 'tesseract', 'ensemble')
+        use_fallback: Whether to use fallback engine if primary fails
+
+    Returns:
+        List of block dictionaries
+    """
+    cache_path = None
+    ocr_results = None
+    if settings.use_ocr_cache and isinstance(image, np.ndarray):
+        cache_path = _ocr_cache_path(image, engine, use_fallback)
+        ocr_results = _read_ocr_cache(cache_path)
+
+    if ocr_results is None:
+        ocr_results = _run_ocr_engines(image, engine, use_fallback)
+        # Empty results may come from an engine error, so only text is cached
+        if cache_path is not None and ocr_results:
+            _write_ocr_cache(cache_path, ocr_results)
+
+    if not ocr_results:
+        logger.warning(f"No text extracted from page {page_index}")
+        return []
+
+    # Group into blocks
+    blocks = group_ocr_results_into_blocks(ocr_results, page_index)
+
+    logger.info(f"Grouped into {len(blocks)} blocks")
+    return blocks
+
+
+def _init_ocr_worker():
+    """Load the OCR engine once when a pool process starts."""
+    if settings.ocr_engine in ("paddleocr", "ensemble") and not settings.ocr_daemon_socket:
+        try:
+            _get_paddleocr()
+        except Exception as e:
+            logger.warning(f"OCR worker could not preload PaddleOCR: {e}")
+
+
+def _get_ocr_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared OCR process pool, or None when OCR runs in-process.
+
+    PaddleOCR is not reliably thread-safe, but its inference is native code
+    that scales across processes. Pool processes are spawned rather than
+    forked so they don't inherit a loaded model or live threads. Celery's
+    prefork children cannot start processes, so enable this (OCR_WORKERS > 1)
+    only with the solo or threads worker pool.
+    """
+    global _ocr_process_pool
+    if settings.ocr_workers <= 1:
+        return None
+    if _ocr_process_pool is None:
+        _ocr_process_pool = ProcessPoolExecutor(
+            max_workers=settings.ocr_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ocr_worker,
+        )
+        logger.info(f"Started OCR process pool with {settings.ocr_workers} workers")
+    return _ocr_process_pool
+
+
+def _reset_ocr_process_pool(broken: ProcessPoolExecutor) -> None:
+    """Discard a broken OCR process pool; the next use starts a fresh one."""
+    global _ocr_process_pool
+    broken.shutdown(wait=False, cancel_futures=True)
+    # Futures from the same broken pool may report in after it was replaced
+    if _ocr_process_pool is broken:
+        _ocr_process_pool = None
+
+
+def _recognize_stream(
+    pages: Iterable[Tuple[int, np.ndarray]],
+    engine: str,
+    use_fallback: bool,
+) -> Iterator[Tuple[int, List[dict]]]:
+    """
+    Recognize preprocessed pages, on the OCR process pool when enabled.
+
+    Keeps a bounded number of pages in flight and yields results in input
+    order. If a pool process dies (e.g. out of memory) the pool is restarted
+    and the affected page is recognized in-process instead of failing the job.
+
+    Args:
+        pages: (page_index, preprocessed image) pairs
+        engine: OCR engine to use ('paddleocr', 'tesseract', 'ensemble')
+        use_fallback: Whether to use fallback engine if primary fails
+
+    Yields:
+        (page_index, blocks) for each page, in input order
+    """
+    pool = _get_ocr_process_pool()
+    if pool is None:
+        for page_index, img in pages:
+            yield page_index, _recognize(img, page_index, engine, use_fallback)
+        return
+
+    in_flight: List[Tuple[int, np.ndarray, ProcessPoolExecutor, Future]] = []
+
+    def submit(page_index: int, img: np.ndarray) -> None:
+        pool = _get_ocr_process_pool()
+        try:
+            future = pool.submit(_recognize, img, page_index, engine, use_fallback)
+        except BrokenProcessPool:
+            _reset_ocr_process_pool(pool)
+            pool = _get_ocr_process_pool()
+            future = pool.submit(_recognize, img, page_index, engine, use_fallback)
+        in_flight.append((page_index, img, pool, future))
+
+    def collect() -> Tuple[int, List[dict]]:
+        page_index, img, pool, future = in_flight.pop(0)
+        try:
+            return page_index, future.result()
+        except BrokenProcessPool:
+            logger.error(f"OCR worker died on page {page_index}, restarting pool")
+            _reset_ocr_process_pool(pool)
+            return page_index, _recognize(img, page_index, engine, use_fallback)
+
+    for page_index, img in pages:
+        submit(page_index, img)
+        if len(in_flight) >= 2 * settings.ocr_workers:
+            yield collect()
+
+    while in_flight:
+        yield collect()
+
+
 def extract_text_from_image(
-    image_path: Path,
+    image_path: Union[Path, np.ndarray],
     page_index: int = 0,
     engine: str = "paddleocr",
     use_fallback: bool = True,
+    source: ImageSource = "scan",
 ) -> List[dict]:
     """
     Extract text from an image using OCR.
 
     Args:
-        image_path: Path to image file
+        image_path: Path to image file, or an already-decoded image array
         page_index: Page index for block IDs
         engine: OCR engine to use ('paddleocr', 'tesseract', 'ensemble')
         use_fallback: Whether to use fallback engine if primary fails
+        source: 'scan' for scans and photos, 'digital' for clean renders,
+            which skip denoising
 
     Returns:
         List of block dictionaries
     """
-    logger.info(f"Extracting text from image: {image_path} using engine: {engine}")
+    if isinstance(image_path, np.ndarray):
+        logger.info(f"Extracting text from in-memory image page {page_index} using engine: {engine}")
+    else:
+        logger.info(f"Extracting text from image: {image_path} using engine: {engine}")
 
-    # Preprocess image
+    # Preprocess image; the OCR engines take the array directly
+    image: Union[Path, np.ndarray]
     try:
-        preprocessed_img = preprocess_image(image_path)
-        # Save preprocessed image temporarily
-        temp_path = image_path.parent / f"temp_{image_path.name}"
-        cv2.imwrite(str(temp_path), preprocessed_img)
-        image_path_to_use = temp_path
+        if isinstance(image_path, np.ndarray):
+            image = preprocess_array(image_path, source)
+        else:
+            image = preprocess_image(image_path, source)
     except Exception as e:
         logger.warning(f"Image preprocessing failed, using original: {e}")
-        image_path_to_use = image_path
+        image = image_path
 
-    ocr_results = []
+    return _recognize(image, page_index, engine, use_fallback)
 
-    try:
-        if engine == "paddleocr" or engine == "ensemble":
-            ocr_results = ocr_with_paddleocr(image_path_to_use)
-            logger.info(f"PaddleOCR found {len(ocr_results)} text regions")
-
-        if (not ocr_results or engine == "tesseract") and (
-            engine == "tesseract" or (use_fallback and settings.use_tesseract_fallback)
-        ):
-            tesseract_results = ocr_with_tesseract(image_path_to_use)
-            logger.info(f"Tesseract found {len(tesseract_results)} text regions")
-
-            if engine == "ensemble":
-                # Use results with higher confidence or longer text
-                # Simple heuristic: prefer longer text if confidence is similar
-                combined_results = {}
-                for text, conf, bbox in ocr_results:
-                    key = tuple(bbox)
-                    if key not in combined_results or len(text) > len(combined_results[key][0]):
-                        combined_results[key] = (text, conf, bbox)
-
-                for text, conf, bbox in tesseract_results:
-                    key = tuple(bbox)
-                    if key not in combined_results or len(text) > len(combined_results[key][0]):
-                        combined_results[key] = (text, conf, bbox)
-
-                ocr_results = list(combined_results.values())
-            elif not ocr_results:
-                ocr_results = tesseract_results
-
-    finally:
-        # Clean up temp file
-        if image_path_to_use != image_path and image_path_to_use.exists():
-            image_path_to_use.unlink()
 
-    if not ocr_results:
-        logger.warning(f"No text extracted from image: {image_path}")
+def extract_text_from_images(
+    images: List[np.ndarray],
+    page_indices: List[int],
+    engine: str = "paddleocr",
+    use_fallback: bool = True,
+) -> List[List[dict]]:
+    """
+    Extract text from several already-decoded page images.
+
+    Pages are preprocessed concurrently (OpenCV releases the GIL) and then
+    recognized one after another with the shared engine instance.
+
+    Args:
+        images: Page images as BGR or grayscale arrays
+        page_indices: Page index for each image, used for block IDs
+        engine: OCR engine to use ('paddleocr', 'tesseract', 'ensemble')
+        use_fallback: Whether to use fallback engine if primary fails
+
+    Returns:
+        One list of block dictionaries per image, in input order
+    """
+    if not images:
         return []
 
-    # Group into blocks
-    blocks = group_ocr_results_into_blocks(ocr_results, page_index)
+    def prepare(img: np.ndarray) -> np.ndarray:
+        try:
+            return preprocess_array(img)
+        except Exception as e:
+            logger.warning(f"Image preprocessing failed, using original: {e}")
+            return img
+
+    with ThreadPoolExecutor(max_workers=min(len(images), os.cpu_count() or 1)) as executor:
+        prepared = list(executor.map(prepare, images))
+
+    return [
+        blocks
+        for _, blocks in _recognize_stream(zip(page_indices, prepared), engine, use_fallback)
+    ]
+
+
+# Marks the end of the stream on a pipeline queue
+_PIPELINE_DONE = object()
 
-    logger.info(f"Grouped into {len(blocks)} blocks")
-    return blocks
 
+class OCRPipeline:
+    """
+    OCR many pages with loading, preprocessing and recognition overlapped.
+
+    Pages flow through three stages connected by bounded queues: a loader
+    thread decodes/renders page images, a preprocessing thread runs OpenCV
+    (which releases the GIL), and the calling thread runs the OCR engine (or
+    feeds the OCR process pool), so the engine instance never crosses threads.
+    Results come out in input order.
+    """
 
+    def __init__(
+        self,
+        engine: str = "paddleocr",
+        use_fallback: bool = True,
+        queue_size: int = 8,
+    ):
+        self.engine = engine
+        self.use_fallback = use_fallback
+        self.queue_size = queue_size
+
+    def run(
+        self,
+        sources: Iterable[Tuple[int, Callable[[], np.ndarray]]],
+    ) -> Iterator[Tuple[int, List[dict]]]:
+        """
+        OCR a sequence of pages.
+
+        Args:
+            sources: (page_index, loader) pairs; each loader returns the page
+                image as a BGR or grayscale array
+
+        Yields:
+            (page_index, blocks) for each page, in input order
+        """
+        loaded: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        preprocessed: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(q: queue.Queue, item) -> bool:
+            # Time out periodically so stages exit if the consumer goes away
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _PIPELINE_DONE
+
+        def load_stage():
+            try:
+                for page_index, loader in sources:
+                    if not put(loaded, (page_index, loader())):
+                        return
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                put(loaded, _PIPELINE_DONE)
+
+        def preprocess_stage():
+            while True:
+                item = get(loaded)
+                if item is _PIPELINE_DONE:
+                    break
+                page_index, img = item
+                try:
+                    img = preprocess_array(img)
+                except Exception as e:
+                    logger.warning(f"Preprocessing page {page_index} failed, using original: {e}")
+                if not put(preprocessed, (page_index, img)):
+                    return
+            put(preprocessed, _PIPELINE_DONE)
+
+        threads = [
+            threading.Thread(target=load_stage, name="ocr-load", daemon=True),
+            threading.Thread(target=preprocess_stage, name="ocr-preprocess", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
 
+        try:
+            yield from _recognize_stream(
+                iter(preprocessed.get, _PIPELINE_DONE), self.engine, self.use_fallback
+            )
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
 
+        if errors:
+            raise errors[0]
@@ -0,0 +1,150 @@
+"""
+Long-lived PaddleOCR daemon.
+
+Holds a single PaddleOCR instance and serves OCR requests from worker
+processes over a unix domain socket, so the model is loaded once instead of
+once per worker (and again after every worker restart). Requests are run one
+at a time on that instance, so all workers pointed at the daemon share one
+engine's throughput: it saves memory and model-load time, not OCR time.
+
+Run with ``python -m app.services.ocr_daemon`` and point the workers at the
+same socket with OCR_DAEMON_SOCKET.
+"""
+
+import logging
+import os
+import threading
+import time
+from multiprocessing.connection import Connection, Listener, wait
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+
+from app.config import get_settings
+from app.services import ocr
+from app.utils.model_status import start_model_status_heartbeat
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+DEFAULT_SOCKET_PATH = "/tmp/ocr.sock"
+
+# Poll interval while no worker is connected or no request is pending
+POLL_SECONDS = 0.01
+
+
+def _read_request(conn: Connection) -> Union[Path, np.ndarray]:
+    """Read one client request: a header, followed by the raw pixels for arrays."""
+    request = conn.recv()
+    if request[0] == "array":
+        _, shape, dtype = request
+        dtype = np.dtype(dtype)
+        # Receive straight into a bytearray, which keeps the array writable
+        # for PaddleOCR's in-place steps
+        data = bytearray(int(np.prod(shape)) * dtype.itemsize)
+        conn.recv_bytes_into(data)
+        return np.frombuffer(data, dtype=dtype).reshape(shape)
+    return Path(request[1])
+
+
+def _accept_connections(
+    listener: Listener,
+    connections: List[Connection],
+    lock: threading.Lock,
+) -> None:
+    """Accept worker connections until the listener is closed."""
+    while True:
+        try:
+            conn = listener.accept()
+        except OSError:
+            return
+        with lock:
+            connections.append(conn)
+
+
+def _drop_connection(
+    conn: Connection,
+    connections: List[Connection],
+    lock: threading.Lock,
+) -> None:
+    """Close and forget a connection whose worker went away."""
+    conn.close()
+    with lock:
+        if conn in connections:
+            connections.remove(conn)
+
+
+def _serve_request(
+    conn: Connection,
+    connections: List[Connection],
+    lock: threading.Lock,
+) -> None:
+    """Read one request from a worker, run OCR and send back the results."""
+    try:
+        image = _read_request(conn)
+    except (OSError, EOFError):
+        _drop_connection(conn, connections, lock)
+        return
+
+    try:
+        response = ("ok", ocr.run_paddleocr(image))
+    except Exception as e:
+        logger.error(f"OCR daemon request failed: {e}")
+        response = ("error", str(e))
+
+    try:
+        conn.send(response)
+    except (OSError, EOFError):
+        _drop_connection(conn, connections, lock)
+
+
+def serve(socket_path: str) -> None:
+    """
+    Serve OCR requests on a unix socket until interrupted.
+
+    Args:
+        socket_path: Filesystem path of the unix socket to listen on
+    """
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    # Load the model before accepting work so the first request isn't slow
+    ocr._get_paddleocr()
+    # Workers leave PaddleOCR out of their reports when the daemon is configured
+    start_model_status_heartbeat(lambda: {"paddleocr": "loaded"})
+
+    listener = Listener(socket_path, "AF_UNIX")
+    connections: List[Connection] = []
+    lock = threading.Lock()
+    threading.Thread(
+        target=_accept_connections,
+        args=(listener, connections, lock),
+        name="ocr-daemon-accept",
+        daemon=True,
+    ).start()
+    logger.info(f"OCR daemon listening on {socket_path}")
+
+    try:
+        while True:
+            with lock:
+                current = list(connections)
+            if not current:
+                time.sleep(POLL_SECONDS)
+                continue
+
+            # PaddleOCR instances are not thread-safe, so requests run in turn
+            for conn in wait(current, timeout=POLL_SECONDS):
+                _serve_request(conn, connections, lock)
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    serve(settings.ocr_daemon_socket or DEFAULT_SOCKET_PATH)
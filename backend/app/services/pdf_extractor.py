@@ -1,103 +1,303 @@
 """PDF and DOCX extraction service with structure preservation."""
 
 import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
+import numpy as np
 import pdfplumber
+import pypdfium2 as pdfium
 from docx import Document as DocxDocument
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
+from app.config import get_settings
+from app.services.ocr import OCRPipeline, extract_text_from_images, read_image_frames
 from app.utils.layout_schema import create_block
-from app.schemas import Page, Block
+from app.schemas import Block, Page
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
-def extract_text_from_pdf_pdfplumber(pdf_path: Path) -> List[dict]:
+# Resolution used when rasterizing scanned PDF pages for OCR
+PDF_RENDER_RESOLUTION = 300
+
+
+# Text runs whose tops differ by less than this (in points) share a paragraph
+PARAGRAPH_Y_THRESHOLD = 10
+
+# PDFium reads a text page in milliseconds, so worker processes only pay off
+# for long documents; each worker handles contiguous runs of pages
+PARALLEL_PDF_MIN_PAGES = 200
+PARALLEL_PDF_MIN_CHUNK = 4
+
+
+def _render_page(page) -> np.ndarray:
+    """Rasterize a pdfplumber page to a grayscale array for OCR."""
+    image = page.to_image(resolution=PDF_RENDER_RESOLUTION).original
+    return np.asarray(image.convert("L"))
+
+
+def _render_pdfium_page(pdf: pdfium.PdfDocument, page_num: int) -> np.ndarray:
+    """Rasterize a PDFium page to a grayscale array for OCR."""
+    page = pdf[page_num]
+    try:
+        # Grayscale is one byte per pixel with no alpha. Each scanned page is
+        # rendered once, so don't keep its decoded images in PDFium's cache;
+        # form fields are never initialized, so skip drawing them.
+        bitmap = page.render(
+            scale=PDF_RENDER_RESOLUTION / 72,
+            grayscale=True,
+            may_draw_forms=False,
+            limit_image_cache=True,
+        )
+        return bitmap.to_numpy()
+    finally:
+        page.close()
+
+
+def _group_text_runs(tops: List[float], texts: List[str], page_num: int) -> List[Block]:
+    """
+    Group text runs (words or lines) into paragraph blocks.
+
+    A new paragraph starts wherever a run's top jumps from the previous run's
+    by at least PARAGRAPH_Y_THRESHOLD.
+
+    Args:
+        tops: Top coordinate of each run, in reading order
+        texts: Text of each run
+        page_num: Page index for block IDs
+
+    Returns:
+        List of blocks
+    """
+    if not texts:
+        return []
+
+    breaks = np.abs(np.diff(np.asarray(tops, dtype=np.float64))) >= PARAGRAPH_Y_THRESHOLD
+    group_ids = np.concatenate(([0], np.cumsum(breaks)))
+
+    blocks = []
+    for block_id_counter, (_, group) in enumerate(
+        groupby(zip(group_ids.tolist(), texts), key=itemgetter(0))
+    ):
+        block_obj = create_block(
+            block_id=f"{page_num}-{block_id_counter}",
+            text=" ".join(text for _, text in group),
+            block_type="paragraph",
+        )
+        blocks.append(block_obj)
+    return blocks
+
+
+def _ocr_scanned_pages(
+    pages: List[Page],
+    scanned_pages: List[int],
+    render: Callable[[int], np.ndarray],
+    ocr_engine: Optional[str],
+) -> None:
+    """
+    OCR pages without a text layer in place, overlapping rendering with recognition.
+
+    Args:
+        pages: Pages, updated in place
+        scanned_pages: Indexes of pages that need OCR
+        render: Rasterizes a page index to an image array
+        ocr_engine: OCR engine to use, or None to skip OCR
+    """
+    if not ocr_engine or not scanned_pages:
+        return
+
+    logger.info(f"Running OCR on {len(scanned_pages)} scanned pages")
+    pipeline = OCRPipeline(engine=ocr_engine)
+    sources = [(page_num, partial(render, page_num)) for page_num in scanned_pages]
+    for page_num, blocks in pipeline.run(sources):
+        pages[page_num] = Page(page_index=page_num, blocks=blocks)
+
+
+def extract_text_from_pdf_pdfium(
+    pdf_path: Path,
+    ocr_engine: Optional[str] = None,
+) -> List[Page]:
+    """
+    Extract text from PDF using PDFium.
+
+    PDFium reads the text layer natively and is much faster than pdfplumber,
+    so it is the default for PDFs. Text comes from PDFium's per-line text
+    rectangles, grouped into paragraphs like the pdfplumber path.
+
+    Args:
+        pdf_path: Path to PDF file
+        ocr_engine: OCR engine for pages without a text layer, or None to skip OCR
+
+    Returns:
+        List of pages
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_count = len(pdf)
+        workers = min(settings.pdf_workers, os.cpu_count() or 1)
+        if workers > 1 and page_count >= PARALLEL_PDF_MIN_PAGES:
+            pages = _extract_pdfium_text_parallel(pdf_path, page_count, workers)
+        else:
+            pages = [_extract_pdfium_page(pdf, page_num) for page_num in range(page_count)]
+
+        scanned_pages = [page.page_index for page in pages if not page.blocks]
+        _ocr_scanned_pages(pages, scanned_pages, partial(_render_pdfium_page, pdf), ocr_engine)
+    finally:
+        pdf.close()
+
+    return pages
+
+
+def _extract_pdfium_page(pdf: pdfium.PdfDocument, page_num: int) -> Page:
+    """Read the text layer of one PDFium page."""
+    page = pdf[page_num]
+    textpage = page.get_textpage()
+
+    tops = []
+    texts = []
+    try:
+        # Image-only pages have no characters; skip the text rectangle layout
+        if textpage.count_chars() > 0:
+            height = page.get_height()
+            for rect_index in range(textpage.count_rects()):
+                left, bottom, right, top = textpage.get_rect(rect_index)
+                text = textpage.get_text_bounded(left, bottom, right, top).strip()
+                if text:
+                    # PDF y grows upwards; convert to distance from the page top
+                    tops.append(height - top)
+                    texts.append(text)
+    finally:
+        textpage.close()
+        page.close()
+
+    blocks = _group_text_runs(tops, texts, page_num)
+    return Page(page_index=page_num, blocks=blocks)
+
+
+def _extract_pdfium_page_range(pdf_path: Path, start: int, stop: int) -> List[Page]:
+    """Read the text layer of pages [start, stop) with a process-local document handle."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return [_extract_pdfium_page(pdf, page_num) for page_num in range(start, stop)]
+    finally:
+        pdf.close()
+
+
+def _extract_pdfium_text_parallel(pdf_path: Path, page_count: int, workers: int) -> List[Page]:
+    """
+    Read the text layer of a long PDF across worker processes.
+
+    PDFium is not thread-safe, so each process opens its own handle. Processes
+    are spawned rather than forked, and Celery's prefork children cannot start
+    them, so this only applies with the solo or threads worker pool.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_count: Number of pages in the document
+        workers: Number of worker processes
+
+    Returns:
+        List of pages, in page order
+    """
+    chunk = max(PARALLEL_PDF_MIN_CHUNK, math.ceil(page_count / (workers * 4)))
+    starts = list(range(0, page_count, chunk))
+    stops = [min(start + chunk, page_count) for start in starts]
+
+    logger.info(f"Reading {page_count} PDF pages with {workers} processes")
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        chunks = executor.map(
+            _extract_pdfium_page_range, [pdf_path] * len(starts), starts, stops
+        )
+        return [page for pages in chunks for page in pages]
+
+
+def extract_text_from_pdf_pdfplumber(
+    pdf_path: Path,
+    ocr_engine: Optional[str] = None,
+) -> List[Page]:
     """
     Extract text from PDF using pdfplumber (alternative method).
 
+    Args:
+        pdf_path: Path to PDF file
+        ocr_engine: OCR engine for pages without a text layer, or None to skip OCR
+
     Returns:
-        List of page dictionaries
+        List of pages
     """
     pages = []
+    scanned_pages = []
     with pdfplumber.open(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages):
-            blocks = []
-            block_id_counter = 0
-
-            # Extract text with layout
+            # Extract text with layout and group words into paragraphs. Words come
+            # out clustered into lines, top to bottom, so they are already in
+            # order; re-sorting by raw top would shuffle words within a line.
             words = page.extract_words()
-            if words:
-                # Group words into paragraphs (simple approach)
-                current_paragraph = []
-                current_y = None
-                y_threshold = 10
-
-                for word in words:
-                    word_y = word["top"]
-                    if current_y is None or abs(word_y - current_y) < y_threshold:
-                        current_paragraph.append(word["text"])
-                        current_y = word_y
-                    else:
-                        # New paragraph
-                        if current_paragraph:
-                            block_text = " ".join(current_paragraph)
-                            block_obj = create_block(
-                                block_id=f"{page_num}-{block_id_counter}",
-                                text=block_text,
-                                block_type="paragraph",
-                            )
-                            blocks.append(block_obj.dict())
-                            block_id_counter += 1
-                        current_paragraph = [word["text"]]
-                        current_y = word_y
+            blocks = _group_text_runs(
+                [word["top"] for word in words], [word["text"] for word in words], page_num
+            )
+            if not blocks:
+                scanned_pages.append(page_num)
 
-                # Don't forget last paragraph
-                if current_paragraph:
-                    block_text = " ".join(current_paragraph)
-                    block_obj = create_block(
-                        block_id=f"{page_num}-{block_id_counter}",
-                        text=block_text,
-                        block_type="paragraph",
-                    )
-                    blocks.append(block_obj.dict())
+            pages.append(Page(page_index=page_num, blocks=blocks))
 
-            pages.append(Page(page_index=page_num, blocks=[Block(**b) for b in blocks]).dict())
+        _ocr_scanned_pages(
+            pages, scanned_pages, lambda page_num: _render_page(pdf.pages[page_num]), ocr_engine
+        )
 
     return pages
 
 
-def extract_text_from_docx(docx_path: Path) -> List[dict]:
+def _heading_info(style_name: str) -> Tuple[bool, Optional[int]]:
+    """Return (is_heading, heading_level) for a DOCX paragraph style name."""
+    if not style_name.startswith("Heading"):
+        return False, None
+    level = style_name.rsplit(" ", 1)[-1]
+    return True, int(level) if level.isdecimal() else 1
+
+
+def extract_text_from_docx(docx_path: Path) -> List[Page]:
     """
     Extract text from DOCX file with structure preservation.
 
     Returns:
-        List of page dictionaries (DOCX doesn't have pages, so we use a single "page")
+        List of pages (DOCX doesn't have pages, so we use a single "page")
     """
     doc = DocxDocument(docx_path)
     blocks = []
     block_id_counter = 0
 
+    paragraph_tag = qn("w:p")
+    heading_styles = {}  # style id -> (is_heading, heading_level)
+    table_tag = qn("w:tbl")
+
+    # Wrap body elements directly in a single pass over the body
     for element in doc.element.body:
-        if element.tag.endswith("p"):  # Paragraph
-            para = None
-            for para_obj in doc.paragraphs:
-                if para_obj._element == element:
-                    para = para_obj
-                    break
+        if element.tag == paragraph_tag:  # Paragraph
+            para = Paragraph(element, doc)
 
             if para:
                 text = para.text.strip()
                 if text:
-                    # Check if heading
-                    is_heading = para.style.name.startswith("Heading")
-                    heading_level = None
-                    if is_heading:
-                        try:
-                            heading_level = int(para.style.name.split()[-1])
-                        except (ValueError, IndexError):
-                            heading_level = 1
+                    # Check if heading; style lookups are slow, so resolve each style once
+                    style_id = element.style
+                    heading_info = heading_styles.get(style_id)
+                    if heading_info is None:
+                        heading_info = heading_styles[style_id] = _heading_info(para.style.name)
+                    is_heading, heading_level = heading_info
 
                     block_type = "heading" if is_heading else "paragraph"
                     block_obj = create_block(
@@ -107,16 +307,11 @@ def extract_text_from_docx(docx_path: Path) -> List[dict]:
                         is_heading=is_heading,
                         heading_level=heading_level,
                     )
-                    blocks.append(block_obj.dict())
+                    blocks.append(block_obj)
                     block_id_counter += 1
 
-        elif element.tag.endswith("tbl"):  # Table
-            # Find corresponding table object
-            table = None
-            for table_obj in doc.tables:
-                if table_obj._element == element:
-                    table = table_obj
-                    break
+        elif element.tag == table_tag:  # Table
+            table = Table(element, doc)
 
             if table:
                 table_id = f"table-{block_id_counter}"
@@ -132,11 +327,11 @@ def extract_text_from_docx(docx_path: Path) -> List[dict]:
                                 table_col=col_idx,
                                 table_id=table_id,
                             )
-                            blocks.append(block_obj.dict())
+                            blocks.append(block_obj)
                             block_id_counter += 1
 
     # DOCX doesn't have pages, so we return a single page
-    return [Page(page_index=0, blocks=[Block(**b) for b in blocks]).dict()]
+    return [Page(page_index=0, blocks=blocks)]
 
 
 def extract_text_from_file(
@@ -144,31 +339,50 @@ def extract_text_from_file(
     file_type: str,
     ocr_callback=None,
     ocr_engine: str = "paddleocr",
-) -> List[dict]:
+) -> List[Page]:
     """
     Extract text from file based on type.
 
     Args:
         file_path: Path to file
         file_type: File type ('pdf', 'docx', 'image')
-        ocr_callback: Function for OCR: (image_path, page_index, engine) -> blocks
+        ocr_callback: Function for OCR: (image path or array, page_index, engine) -> blocks
         ocr_engine: OCR engine to use
 
     Returns:
-        List of page dictionaries
+        List of pages
     """
     logger.info(f"Extracting text from {file_type} file: {file_path}")
 
     if file_type == "pdf":
-        # Use pdfplumber for PDF extraction
-        return extract_text_from_pdf_pdfplumber(file_path)
+        # Use PDFium for PDF extraction, with OCR for scanned pages
+        try:
+            return extract_text_from_pdf_pdfium(file_path, ocr_engine=ocr_engine)
+        except pdfium.PdfiumError as e:
+            logger.warning(f"PDFium extraction failed, falling back to pdfplumber: {e}")
+            return extract_text_from_pdf_pdfplumber(file_path, ocr_engine=ocr_engine)
     elif file_type == "docx":
         return extract_text_from_docx(file_path)
     elif file_type in ["image", "jpg", "jpeg", "png", "tiff", "tif"]:
-        if ocr_callback:
-            return [ocr_callback(file_path, 0, ocr_engine)]
-        else:
+        if not ocr_callback:
             raise ValueError("OCR callback required for image files")
+
+        # Multi-page TIFFs are OCR'd together; single images go through the callback
+        frames = []
+        if file_path.suffix.lower() in (".tif", ".tiff"):
+            frames = read_image_frames(file_path)
+        if len(frames) > 1:
+            page_blocks = extract_text_from_images(frames, list(range(len(frames))), ocr_engine)
+        elif frames:
+            # Already decoded; don't read the file again
+            page_blocks = [ocr_callback(frames[0], 0, ocr_engine)]
+        else:
+            page_blocks = [ocr_callback(file_path, 0, ocr_engine)]
+
+        return [
+            Page(page_index=page_index, blocks=blocks)
+            for page_index, blocks in enumerate(page_blocks)
+        ]
     else:
         raise ValueError(f"Unsupported file type: {file_type}")
 
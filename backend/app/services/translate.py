@@ -1,7 +1,9 @@
 """Translation service using open-source models."""
 
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from langdetect import detect, LangDetectException
 
@@ -15,11 +17,21 @@ settings = get_settings()
 # Lazy loading of translation model
 _translation_model = None
 _translation_tokenizer = None
+_translation_device = None
+_batch_fallback_logged = False
+
+# Beam width for translation; inputs shorter than GREEDY_MAX_INPUT_TOKENS gain
+# little from beam search and are decoded greedily
+TRANSLATION_NUM_BEAMS = 5
+GREEDY_MAX_INPUT_TOKENS = 20
+
+# Detected languages are cached per text; headers, footers and boilerplate repeat
+LANGUAGE_CACHE_SIZE = 4096
 
 
 def _load_translation_model():
     """Load translation model and tokenizer."""
-    global _translation_model, _translation_tokenizer
+    global _translation_model, _translation_tokenizer, _translation_device
     if _translation_model is None:
         try:
             from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
@@ -35,15 +47,84 @@ def _load_translation_model():
 
             device = "cuda" if torch.cuda.is_available() else "cpu"
             _translation_model = _translation_model.to(device)
+            if device == "cuda":
+                # Half-precision weights halve memory traffic and use tensor cores
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                _translation_model = _translation_model.to(dtype)
             _translation_model.eval()
+            _translation_device = device
 
-            logger.info(f"Translation model loaded on {device}")
+            logger.info(f"Translation model loaded on {device} ({_translation_model.dtype})")
         except Exception as e:
             logger.error(f"Failed to load translation model: {e}")
             raise
     return _translation_model, _translation_tokenizer
 
 
+def _prepare_inputs(tokenizer, texts: List[str]) -> dict:
+    """
+    Tokenize a sub-batch and start copying it to the model's device.
+
+    On GPU the tensors are pinned so the copy is asynchronous and can overlap
+    with generation of the previous sub-batch.
+
+    Args:
+        tokenizer: Tokenizer for the model
+        texts: Texts in the sub-batch
+
+    Returns:
+        Tokenized inputs on the model's device
+    """
+    # Pad only to the sub-batch's longest input
+    inputs = tokenizer(
+        texts,
+        return_tensors="pt",
+        padding="longest",
+        truncation=True,
+        max_length=settings.max_length,
+    )
+    if _translation_device == "cuda":
+        return {
+            k: v.pin_memory().to(_translation_device, non_blocking=True)
+            for k, v in inputs.items()
+        }
+    return {k: v.to(_translation_device) for k, v in inputs.items()}
+
+
+def _generate(model, tokenizer, inputs: dict, target_lang: str):
+    """
+    Generate translations for tokenized inputs.
+
+    Uses beam search, except for batches whose longest input is short, where
+    greedy decoding gives the same output for a fraction of the work.
+
+    Args:
+        model: Translation model
+        tokenizer: Tokenizer for the model
+        inputs: Tokenized inputs already on the model's device
+        target_lang: Target language code (NLLB format)
+
+    Returns:
+        Generated token IDs
+    """
+    import torch
+
+    longest_input = int(inputs["attention_mask"].sum(dim=1).max())
+    num_beams = 1 if longest_input < GREEDY_MAX_INPUT_TOKENS else TRANSLATION_NUM_BEAMS
+
+    beam_kwargs = {"num_beams": num_beams}
+    if num_beams > 1:
+        beam_kwargs["early_stopping"] = True
+
+    with torch.inference_mode():
+        return model.generate(
+            **inputs,
+            forced_bos_token_id=tokenizer.convert_tokens_to_ids(target_lang),
+            max_length=settings.max_length,
+            **beam_kwargs,
+        )
+
+
 def detect_text_language(text: str) -> Optional[str]:
     """
     Detect language of text.
@@ -51,7 +132,12 @@ def detect_text_language(text: str) -> Optional[str]:
     """
     if not text or len(text.strip()) < 3:
         return None
+    return _detect_text_language_cached(text)
+
 
+@lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def _detect_text_language_cached(text: str) -> Optional[str]:
+    """Detect language of a non-trivial text (see `detect_text_language`)."""
     # First try simple Arabic detection
     lang = detect_language(text)
     if lang:
@@ -111,18 +197,10 @@ def translate_text(
         )
 
         # Move to same device as model
-        device = next(model.parameters()).device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        inputs = {k: v.to(_translation_device) for k, v in inputs.items()}
 
         # Translate
-        with model.no_grad():
-            translated_tokens = model.generate(
-                **inputs,
-                forced_bos_token_id=tokenizer.convert_tokens_to_ids(target_lang),
-                max_length=settings.max_length,
-                num_beams=5,
-                early_stopping=True,
-            )
+        translated_tokens = _generate(model, tokenizer, inputs, target_lang)
 
         # Decode
         translated_text = tokenizer.decode(translated_tokens[0], skip_special_tokens=True)
@@ -142,6 +220,9 @@ def translate_batch(
     """
     Translate a batch of texts (more efficient).
 
+    Texts are sorted by token length and generated in sub-batches of
+    ``settings.batch_size``, so short texts aren't padded to a long outlier.
+
     Args:
         texts: List of texts to translate
         source_lang: Source language code
@@ -151,6 +232,7 @@ def translate_batch(
     Returns:
         List of translated texts
     """
+    global _batch_fallback_logged
     if not texts:
         return []
 
@@ -183,33 +265,43 @@ def translate_batch(
     try:
         model, tokenizer = _load_translation_model()
 
-        # Tokenize batch
-        inputs = tokenizer(
-            texts_to_translate_list,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=settings.max_length,
-        )
-
-        # Move to same device as model
-        device = next(model.parameters()).device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
-
-        # Translate
-        with model.no_grad():
-            translated_tokens = model.generate(
-                **inputs,
-                forced_bos_token_id=tokenizer.convert_tokens_to_ids(target_lang),
-                max_length=settings.max_length,
-                num_beams=5,
-                early_stopping=True,
+        # Sort by token length so each sub-batch pads to similar lengths
+        lengths = [
+            len(input_ids)
+            for input_ids in tokenizer(
+                texts_to_translate_list, truncation=True, max_length=settings.max_length
+            )["input_ids"]
+        ]
+        order = sorted(range(len(texts_to_translate_list)), key=lengths.__getitem__)
+
+        batch_size = settings.batch_size
+        sub_batches = [
+            order[start : start + batch_size] for start in range(0, len(order), batch_size)
+        ]
+        translated_texts = [""] * len(texts_to_translate_list)
+
+        # Tokenize the next sub-batch in the background while the current one generates
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="translate-prefetch") as prefetch:
+            next_inputs = prefetch.submit(
+                _prepare_inputs, tokenizer, [texts_to_translate_list[i] for i in sub_batches[0]]
             )
-
-        # Decode
-        translated_texts = tokenizer.batch_decode(
-            translated_tokens, skip_special_tokens=True
-        )
+            for batch_index, sub_batch in enumerate(sub_batches):
+                inputs = next_inputs.result()
+                if batch_index + 1 < len(sub_batches):
+                    next_inputs = prefetch.submit(
+                        _prepare_inputs,
+                        tokenizer,
+                        [texts_to_translate_list[i] for i in sub_batches[batch_index + 1]],
+                    )
+
+                # Translate
+                translated_tokens = _generate(model, tokenizer, inputs, target_lang)
+
+                # Decode and scatter back to input order
+                decoded = tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)
+                for i, translated in zip(sub_batch, decoded):
+                    translated_texts[i] = translated
+                logger.info(f"Translated batch {batch_index + 1}/{len(sub_batches)}")
 
         # Map back to original indices
         result = [""] * len(texts)
@@ -223,7 +315,9 @@ def translate_batch(
 
         return result
     except Exception as e:
-        logger.error(f"Batch translation error: {e}")
+        # Log the first failure with its traceback so a broken batch path is obvious
+        logger.error(f"Batch translation error: {e}", exc_info=not _batch_fallback_logged)
+        _batch_fallback_logged = True
         # Fallback to individual translation
         logger.info("Falling back to individual translation")
         return [translate_text(text, source_lang, target_lang, skip_if_english) for text in texts]
@@ -247,29 +341,28 @@ def translate_document(
     """
     logger.info(f"Translating document with {len(document.pages)} pages")
 
-    # Collect all texts for batch translation
+    # Collect unique texts for batch translation; repeated headers, footers and
+    # boilerplate are translated once and shared by every block that has them
     all_texts = []
-    text_to_block = {}  # Map text index to (page_idx, block_idx)
+    text_to_idx: Dict[str, int] = {}  # text -> text index
+    block_to_text_idx: Dict[Tuple[int, int], int] = {}  # (page_idx, block_idx) -> text index
 
     for page_idx, page in enumerate(document.pages):
         for block_idx, block in enumerate(page.blocks):
-            if block.text.strip():
-                text_idx = len(all_texts)
-                all_texts.append(block.text)
-                text_to_block[text_idx] = (page_idx, block_idx)
-
-    logger.info(f"Translating {len(all_texts)} text blocks")
-
-    # Translate in batches
-    batch_size = settings.batch_size
-    translated_texts = []
-    for i in range(0, len(all_texts), batch_size):
-        batch = all_texts[i : i + batch_size]
-        batch_translated = translate_batch(
-            batch, source_lang=source_lang, target_lang=target_lang
-        )
-        translated_texts.extend(batch_translated)
-        logger.info(f"Translated batch {i // batch_size + 1}/{(len(all_texts) + batch_size - 1) // batch_size}")
+            text = block.text
+            if text.strip():
+                text_idx = text_to_idx.get(text)
+                if text_idx is None:
+                    text_idx = text_to_idx[text] = len(all_texts)
+                    all_texts.append(text)
+                block_to_text_idx[(page_idx, block_idx)] = text_idx
+
+    logger.info(
+        f"Translating {len(all_texts)} unique texts from {len(block_to_text_idx)} text blocks"
+    )
+
+    # Translate in length-sorted batches of settings.batch_size
+    translated_texts = translate_batch(all_texts, source_lang=source_lang, target_lang=target_lang)
 
     # Reconstruct document with translated texts
     translated_pages = []
@@ -277,11 +370,7 @@ def translate_document(
         translated_blocks = []
         for block_idx, block in enumerate(page.blocks):
             # Find corresponding translated text
-            text_idx = None
-            for idx, (p_idx, b_idx) in text_to_block.items():
-                if p_idx == page_idx and b_idx == block_idx:
-                    text_idx = idx
-                    break
+            text_idx = block_to_text_idx.get((page_idx, block_idx))
 
             if text_idx is not None and text_idx < len(translated_texts):
                 translated_text = translated_texts[text_idx]
@@ -5,9 +5,13 @@ import logging
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
+from kombu import Exchange, Queue
+import numpy as np
+import orjson
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -15,13 +19,16 @@ from app.database import SessionLocal
 from app.models import Job, JobStatus, ProcessingStage
 from app.schemas import StructuredDocument
 from app.services.docx_generator import generate_docx_from_document, generate_txt_from_document
-from app.services.ocr import extract_text_from_image
+from app.services.ocr import extract_text_from_image, prune_ocr_cache
 from app.services.pdf_extractor import extract_text_from_file
 from app.services.translate import translate_document
+from app.utils import job_cache
+from app.utils.file_handler import get_results_dir
 from app.utils.layout_schema import (
     calculate_document_stats,
     create_empty_document,
 )
+from app.utils.model_status import report_model_status, start_model_status_heartbeat
 from app.utils.text_normalizer import normalize_arabic_text
 
 logger = logging.getLogger(__name__)
@@ -47,14 +54,47 @@ celery_app.conf.update(
     enable_utc=True,
     task_time_limit=settings.job_timeout_minutes * 60,
     task_soft_time_limit=(settings.job_timeout_minutes * 60) - 60,
+    # Document jobs run for minutes: reserve one at a time so idle workers pick
+    # up new jobs instead of them waiting behind another worker's prefetch
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    task_routes={"process_document": {"queue": settings.celery_queue}},
+    # The jobs table is the source of truth, so skip broker-side persistence
+    task_queues=(
+        Queue(
+            settings.celery_queue,
+            Exchange(settings.celery_queue, delivery_mode=1),
+            routing_key=settings.celery_queue,
+            durable=False,
+        ),
+    ),
 )
 
 
+@worker_init.connect
+def _prepare_worker(**kwargs):
+    """Create working directories once when the worker starts."""
+    settings.ensure_dirs()
+
+
+@worker_process_init.connect
+def _start_model_status_heartbeat(**kwargs):
+    """Report model status from each pool process, where the models are loaded."""
+    start_model_status_heartbeat()
+
+
 def get_db_session() -> Session:
     """Get database session."""
     return SessionLocal()
 
 
+def commit_job(db: Session, job_id: str) -> None:
+    """Commit pending job changes and drop any cached API responses for the job."""
+    db.commit()
+    job_cache.invalidate_job(job_id)
+
+
 def update_job_status(
     job_id: str,
     status: JobStatus,
@@ -64,7 +104,7 @@ def update_job_status(
     """Update job status in database."""
     db = get_db_session()
     try:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = db.get(Job, job_id)
         if job:
             job.status = status
             job.updated_at = datetime.utcnow()
@@ -74,7 +114,7 @@ def update_job_status(
                 job.error_traceback = error_traceback
             if status == JobStatus.COMPLETED:
                 job.completed_at = datetime.utcnow()
-            db.commit()
+            commit_job(db, job_id)
     except Exception as e:
         logger.error(f"Error updating job status: {e}")
         db.rollback()
@@ -82,25 +122,42 @@ def update_job_status(
         db.close()
 
 
-def update_processing_stage(job_id: str, stage: str, stage_status: ProcessingStage):
-    """Update processing stage status."""
-    db = get_db_session()
-    try:
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            if stage == "extraction":
-                job.extraction_stage = stage_status
-            elif stage == "ocr":
-                job.ocr_stage = stage_status
-            elif stage == "translation":
-                job.translation_stage = stage_status
-            job.updated_at = datetime.utcnow()
-            db.commit()
-    except Exception as e:
-        logger.error(f"Error updating processing stage: {e}")
-        db.rollback()
-    finally:
-        db.close()
+def update_processing_stage(job: Job, stage: str, stage_status: ProcessingStage):
+    """
+    Update processing stage status on a job loaded in the caller's session.
+
+    The change is not committed; it goes out with the caller's next status commit.
+    """
+    if stage == "extraction":
+        job.extraction_stage = stage_status
+    elif stage == "ocr":
+        job.ocr_stage = stage_status
+    elif stage == "translation":
+        job.translation_stage = stage_status
+    job.updated_at = datetime.utcnow()
+
+
+def write_result_files(
+    job_id: str,
+    lang_suffix: str,
+    document: StructuredDocument,
+    document_data: dict,
+) -> Path:
+    """
+    Write the JSON, TXT and DOCX downloads for a finished result document.
+
+    Returns:
+        Path to the JSON file
+    """
+    results_dir = get_results_dir(job_id)
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    json_path = results_dir / f"{lang_suffix}.json"
+    json_path.write_bytes(orjson.dumps(document_data, option=orjson.OPT_INDENT_2))
+    generate_txt_from_document(document, results_dir / f"{lang_suffix}.txt")
+    generate_docx_from_document(document, results_dir / f"{lang_suffix}.docx")
+
+    return json_path
 
 
 @celery_app.task(bind=True, name="process_document")
@@ -116,7 +173,7 @@ def process_document_task(self, job_id: str):
 
     try:
         # Get job from database
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = db.get(Job, job_id)
         if not job:
             logger.error(f"Job {job_id} not found")
             return
@@ -126,7 +183,7 @@ def process_document_task(self, job_id: str):
         # Update status
         job.status = JobStatus.PROCESSING
         job.updated_at = datetime.utcnow()
-        db.commit()
+        commit_job(db, job_id)
 
         file_path = Path(job.file_path)
         if not file_path.exists():
@@ -141,12 +198,12 @@ def process_document_task(self, job_id: str):
 
         # Step 1: Extract text from file
         logger.info("Step 1: Extracting text from file")
-        update_processing_stage(job_id, "extraction", ProcessingStage.IN_PROGRESS)
+        update_processing_stage(job, "extraction", ProcessingStage.IN_PROGRESS)
         job.status = JobStatus.EXTRACTING
-        db.commit()
+        commit_job(db, job_id)
 
-        def ocr_callback(img_path: Path, page_idx: int, engine: str):
-            """OCR callback for image pages."""
+        def ocr_callback(img_path: Union[Path, np.ndarray], page_idx: int, engine: str):
+            """OCR callback for image pages (a file path or a decoded image)."""
             return extract_text_from_image(img_path, page_idx, engine)
 
         # Determine file type
@@ -159,7 +216,7 @@ def process_document_task(self, job_id: str):
             file_type = "image"
 
         # Extract pages
-        pages_data = extract_text_from_file(
+        pages = extract_text_from_file(
             file_path,
             file_type,
             ocr_callback=ocr_callback,
@@ -171,18 +228,12 @@ def process_document_task(self, job_id: str):
             source_filename=job.original_filename,
             language="ar",
             ocr_engine=ocr_engine if file_type == "image" or any(
-                p.get("blocks") for p in pages_data
+                page.blocks for page in pages
             ) else None,
         )
 
-        # Convert pages data to Page objects
-        arabic_doc.pages = [
-            Page(
-                page_index=p["page_index"],
-                blocks=[Block(**b) for b in p.get("blocks", [])],
-            )
-            for p in pages_data
-        ]
+        # The extractor already returns validated Page objects
+        arabic_doc.pages = pages
 
         arabic_doc.metadata.total_pages = len(arabic_doc.pages)
 
@@ -192,26 +243,23 @@ def process_document_task(self, job_id: str):
             for block in page.blocks:
                 block.text = normalize_arabic_text(block.text)
 
-        update_processing_stage(job_id, "extraction", ProcessingStage.COMPLETED)
+        update_processing_stage(job, "extraction", ProcessingStage.COMPLETED)
 
         # Step 2: OCR (if needed - already done during extraction)
         if file_type == "image" or any(
             len(page.blocks) == 0 for page in arabic_doc.pages
         ):
             logger.info("Step 2: Running OCR")
-            update_processing_stage(job_id, "ocr", ProcessingStage.IN_PROGRESS)
+            update_processing_stage(job, "ocr", ProcessingStage.IN_PROGRESS)
             job.status = JobStatus.OCR
-            db.commit()
-            # OCR already handled in extraction step
-            update_processing_stage(job_id, "ocr", ProcessingStage.COMPLETED)
-        else:
-            update_processing_stage(job_id, "ocr", ProcessingStage.COMPLETED)
+            commit_job(db, job_id)
 
         # Step 3: Translate
         logger.info("Step 3: Translating document")
-        update_processing_stage(job_id, "translation", ProcessingStage.IN_PROGRESS)
+        update_processing_stage(job, "ocr", ProcessingStage.COMPLETED)
+        update_processing_stage(job, "translation", ProcessingStage.IN_PROGRESS)
         job.status = JobStatus.TRANSLATING
-        db.commit()
+        commit_job(db, job_id)
 
         english_doc = translate_document(
             arabic_doc,
@@ -219,7 +267,7 @@ def process_document_task(self, job_id: str):
             target_lang=target_lang,
         )
 
-        update_processing_stage(job_id, "translation", ProcessingStage.COMPLETED)
+        update_processing_stage(job, "translation", ProcessingStage.COMPLETED)
 
         # Calculate statistics
         arabic_stats = calculate_document_stats(arabic_doc)
@@ -229,6 +277,18 @@ def process_document_task(self, job_id: str):
         job.arabic_json = arabic_doc.dict()
         job.english_json = english_doc.dict()
 
+        # Pre-generate downloads so the API can serve them straight from disk;
+        # the API falls back to generating on demand if this fails
+        try:
+            job.arabic_json_path = str(
+                write_result_files(job_id, "arabic", arabic_doc, job.arabic_json)
+            )
+            job.english_json_path = str(
+                write_result_files(job_id, "english", english_doc, job.english_json)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write result files for job {job_id}: {e}")
+
         job.stats = {
             "total_pages": arabic_stats["total_pages"],
             "total_blocks": arabic_stats["total_blocks"],
@@ -240,7 +300,7 @@ def process_document_task(self, job_id: str):
         job.status = JobStatus.COMPLETED
         job.completed_at = datetime.utcnow()
         job.updated_at = datetime.utcnow()
-        db.commit()
+        commit_job(db, job_id)
 
         logger.info(f"Job {job_id} completed successfully")
 
@@ -256,11 +316,17 @@ def process_document_task(self, job_id: str):
             job.error_message = error_msg
             job.error_traceback = error_tb
             job.updated_at = datetime.utcnow()
-            db.commit()
+            commit_job(db, job_id)
 
         # Re-raise for Celery to handle
         raise
 
     finally:
         db.close()
+        if settings.use_ocr_cache:
+            prune_ocr_cache()
+        # Publish newly loaded models now rather than on the next heartbeat;
+        # pools without worker_process_init (solo, threads) start it here
+        report_model_status()
+        start_model_status_heartbeat()
 
@@ -1,74 +1,209 @@
 """File handling utilities for uploads and downloads."""
 
 import hashlib
+import io
 import mimetypes
+import mmap
+import os
 import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
-from uuid import uuid4
+from typing import BinaryIO, Optional, Tuple
 
 from app.config import get_settings
 
 settings = get_settings()
 
+# Read uploads in 1 MiB chunks so memory stays flat regardless of file size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed through a memory map in a single update
+HASH_MMAP_MIN_SIZE = 10 << 20
+
+
+class FileTooLargeError(Exception):
+    """Raised when an uploaded file exceeds the configured size limit."""
+
 
 def get_file_extension(filename: str) -> str:
-    """Get file extension from filename."""
-    return Path(filename).suffix.lower()
+    """Get file extension from filename (same result as ``Path.suffix``, lowercased)."""
+    ext = os.path.splitext(filename)[1]
+    # Path.suffix has no suffix for a trailing dot ("name.")
+    return ext.lower() if ext != "." else ""
 
 
 def is_allowed_file_type(filename: str) -> bool:
     """Check if file type is allowed."""
-    ext = get_file_extension(filename)
-    return ext in settings.allowed_file_extensions
+    return get_file_extension(filename) in settings.allowed_file_extensions
 
 
 def generate_unique_filename(original_filename: str) -> str:
     """Generate a unique filename for storage."""
-    ext = get_file_extension(original_filename)
-    unique_id = str(uuid4())
-    return f"{unique_id}{ext}"
+    # 128 random bits as hex: as unique as a UUID4 without building one
+    return f"{os.urandom(16).hex()}{get_file_extension(original_filename)}"
 
 
-def save_uploaded_file(file_content: bytes, original_filename: str) -> Tuple[Path, str]:
+def save_uploaded_file(
+    file_obj: BinaryIO,
+    original_filename: str,
+    max_size: Optional[int] = None,
+) -> Tuple[Path, str, int]:
     """
-    Save uploaded file to disk.
+    Stream an uploaded file to disk.
+
+    Uploads already spooled to disk are copied by the kernel; anything else is
+    copied in fixed-size chunks.
+
+    Args:
+        file_obj: Readable binary file-like object (e.g. ``UploadFile.file``)
+        original_filename: Original name of the uploaded file
+        max_size: Maximum allowed size in bytes, or None for no limit
 
     Returns:
-        Tuple of (file_path, unique_filename)
+        Tuple of (file_path, unique_filename, file_size)
+
+    Raises:
+        FileTooLargeError: If the upload exceeds ``max_size``; the partial file is removed
     """
     unique_filename = generate_unique_filename(original_filename)
     file_path = settings.upload_dir / unique_filename
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, "wb") as f:
-        f.write(file_content)
+    try:
+        with open(file_path, "wb") as f:
+            file_size = _copy_upload_in_kernel(file_obj, f, max_size)
+            if file_size is None:
+                file_size = _copy_upload_in_chunks(file_obj, f, max_size)
+    except BaseException:
+        file_path.unlink(missing_ok=True)
+        raise
+
+    return file_path, unique_filename, file_size
+
+
+def _upload_fileno(file_obj: BinaryIO) -> Optional[int]:
+    """Return the OS file descriptor holding an upload's data, if it is on disk."""
+    # Asking a SpooledTemporaryFile that is still in memory for its fileno
+    # would write it out to disk first
+    if isinstance(file_obj, tempfile.SpooledTemporaryFile) and not file_obj._rolled:
+        return None
+    try:
+        return file_obj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _copy_upload_in_kernel(
+    file_obj: BinaryIO,
+    dst: BinaryIO,
+    max_size: Optional[int],
+) -> Optional[int]:
+    """
+    Copy an on-disk upload with copy_file_range, without passing the data through Python.
+
+    Large uploads are spooled to a temporary file by the web framework, so the
+    kernel can copy them straight into the destination file.
+
+    Returns:
+        Number of bytes copied, or None if the upload has to be copied in chunks instead
+    """
+    src_fd = _upload_fileno(file_obj)
+    if src_fd is None or not hasattr(os, "copy_file_range"):
+        return None
+
+    # Reads through the file object may be buffered ahead of the OS offset
+    offset = file_obj.tell()
+    remaining = os.fstat(src_fd).st_size - offset
+    if max_size is not None and remaining > max_size:
+        raise FileTooLargeError(f"File size exceeds maximum of {max_size} bytes")
+
+    copied = 0
+    while copied < remaining:
+        try:
+            count = os.copy_file_range(src_fd, dst.fileno(), remaining - copied, offset + copied)
+        except OSError:
+            # Not supported between these filesystems; copy in chunks instead
+            if copied:
+                raise
+            return None
+        if not count:
+            break
+        copied += count
+    return copied
+
+
+def _copy_upload_in_chunks(file_obj: BinaryIO, dst: BinaryIO, max_size: Optional[int]) -> int:
+    """
+    Copy an upload in fixed-size chunks, enforcing the size limit as we go.
+
+    Chunks are read into one buffer reused for the whole transfer rather than
+    a new bytes object per chunk. The buffer is per call because uploads are
+    saved concurrently from the threadpool.
+    """
+    buffer = bytearray(UPLOAD_CHUNK_SIZE)
+    view = memoryview(buffer)
+    file_size = 0
+    while True:
+        count = file_obj.readinto(buffer)
+        if not count:
+            break
+        file_size += count
+        if max_size is not None and file_size > max_size:
+            raise FileTooLargeError(f"File size exceeds maximum of {max_size} bytes")
+        dst.write(view[:count])
+    return file_size
+
+
+def get_results_dir(job_id: str) -> Path:
+    """Get the directory holding a job's pre-generated result files."""
+    return settings.upload_dir / "results" / job_id
 
-    return file_path, unique_filename
+
+def get_ocr_cache_dir() -> Path:
+    """Get the directory holding cached OCR results, keyed by page image hash."""
+    return settings.upload_dir / "ocr_cache"
 
 
 def get_file_mime_type(filename: str) -> str:
     """Get MIME type for file."""
-    mime_type, _ = mimetypes.guess_type(filename)
+    return _mime_type_for_extension(get_file_extension(filename))
+
+
+@lru_cache(maxsize=128)
+def _mime_type_for_extension(ext: str) -> str:
+    """Get the MIME type for a lowercased file extension."""
+    mime_type, _ = mimetypes.guess_type(f"file{ext}")
     return mime_type or "application/octet-stream"
 
 
 def calculate_file_hash(file_path: Path) -> str:
-    """Calculate SHA256 hash of file."""
-    sha256_hash = hashlib.sha256()
+    """
+    Calculate SHA256 hash of file.
+
+    Both paths hand OpenSSL large buffers without a Python-level loop, so it
+    can use the CPU's SHA extensions: large files are memory-mapped and hashed
+    in one update, with the kernel reading pages ahead; smaller ones go
+    through hashlib.file_digest, which reads into a reused buffer.
+    """
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+        if file_path.stat().st_size < HASH_MMAP_MIN_SIZE:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        sha256_hash = hashlib.sha256()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            sha256_hash.update(mm)
     return sha256_hash.hexdigest()
 
 
 def delete_file(file_path: Path) -> bool:
-    """Delete a file safely."""
+    """Delete a file safely; returns False if it did not exist or could not be removed."""
+    # Try the unlink directly instead of stat-ing first
     try:
-        if file_path.exists():
-            file_path.unlink()
-            return True
-        return False
+        file_path.unlink()
+        return True
     except Exception:
         return False
 
@@ -0,0 +1,86 @@
+"""Redis-backed cache for job status and result responses."""
+
+import logging
+from typing import Optional
+
+from app.config import get_settings
+from app.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# TTLs in seconds: in-flight jobs change often, finished jobs never change
+ACTIVE_JOB_TTL = 5
+TERMINAL_JOB_TTL = 3600
+
+
+def _get_redis():
+    """Get a pooled Redis client, or None when Redis is not configured."""
+    # Redis is not used when running locally with the in-memory broker
+    if settings.celery_broker_url.startswith("memory://"):
+        return None
+    return get_redis()
+
+
+def _job_key(job_id: str) -> str:
+    """Cache key for a job status response."""
+    return f"job:{job_id}"
+
+
+def _result_key(job_id: str) -> str:
+    """Cache key for a job result response."""
+    return f"job:{job_id}:result"
+
+
+def _get(key: str) -> Optional[bytes]:
+    """Read a cached payload; cache errors are treated as misses."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except Exception as e:
+        logger.warning(f"Job cache read failed for {key}: {e}")
+        return None
+
+
+def _set(key: str, payload: bytes, ttl: int) -> None:
+    """Write a cached payload; cache errors are logged and ignored."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        client.set(key, payload, ex=ttl)
+    except Exception as e:
+        logger.warning(f"Job cache write failed for {key}: {e}")
+
+
+def get_cached_job(job_id: str) -> Optional[bytes]:
+    """Get the cached JSON job status response, if any."""
+    return _get(_job_key(job_id))
+
+
+def cache_job(job_id: str, payload: bytes, terminal: bool) -> None:
+    """Cache a JSON job status response; terminal jobs are kept longer."""
+    _set(_job_key(job_id), payload, TERMINAL_JOB_TTL if terminal else ACTIVE_JOB_TTL)
+
+
+def get_cached_result(job_id: str) -> Optional[bytes]:
+    """Get the cached JSON job result response, if any."""
+    return _get(_result_key(job_id))
+
+
+def cache_result(job_id: str, payload: bytes) -> None:
+    """Cache a JSON job result response. Results only exist for completed jobs."""
+    _set(_result_key(job_id), payload, TERMINAL_JOB_TTL)
+
+
+def invalidate_job(job_id: str) -> None:
+    """Drop all cached responses for a job after it changes."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(_job_key(job_id), _result_key(job_id))
+    except Exception as e:
+        logger.warning(f"Job cache invalidation failed for job {job_id}: {e}")
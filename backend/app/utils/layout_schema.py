@@ -71,13 +71,17 @@ def create_page(page_index: int, blocks: List[Block]) -> Page:
 
 def calculate_document_stats(document: StructuredDocument) -> dict:
     """Calculate statistics for a document."""
-    total_blocks = sum(len(page.blocks) for page in document.pages)
-    total_characters = sum(
-        len(block.text) for page in document.pages for block in page.blocks
-    )
+    # Count blocks and characters in a single pass over the pages
+    pages = document.pages
+    total_blocks = 0
+    total_characters = 0
+    for page in pages:
+        blocks = page.blocks
+        total_blocks += len(blocks)
+        total_characters += sum([len(block.text) for block in blocks])
 
     return {
-        "total_pages": len(document.pages),
+        "total_pages": len(pages),
         "total_blocks": total_blocks,
         "total_characters": total_characters,
     }
@@ -0,0 +1,130 @@
+"""Model load status, reported by workers and read by the health check."""
+
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from app.config import get_settings
+from app.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Each process reports under its own key, so prefork children don't overwrite
+# each other; keys expire unless refreshed, so a crashed worker drops out
+MODEL_STATUS_KEY_PREFIX = "worker:models:"
+MODEL_STATUS_TTL_SECONDS = 60
+MODEL_STATUS_REFRESH_SECONDS = 20
+
+MODEL_NAMES = ("paddleocr", "nllb")
+
+_heartbeat_started = False
+_heartbeat_lock = threading.Lock()
+
+
+def _model_status_key() -> str:
+    """Get the Redis key this process reports its model status under."""
+    return f"{MODEL_STATUS_KEY_PREFIX}{socket.gethostname()}:{os.getpid()}"
+
+
+def get_local_model_status() -> Dict[str, str]:
+    """Report which models are loaded in this process, without loading them."""
+    from app.services import ocr, translate
+
+    return {
+        "paddleocr": "loaded" if ocr._paddleocr_instance is not None else "not_loaded",
+        "nllb": "loaded" if translate._translation_model is not None else "not_loaded",
+    }
+
+
+def get_worker_model_status() -> Dict[str, str]:
+    """Get the status a Celery worker process reports for its own models."""
+    status = get_local_model_status()
+    if settings.ocr_daemon_socket:
+        # PaddleOCR lives in the OCR daemon, which reports it itself
+        del status["paddleocr"]
+    return status
+
+
+def report_model_status(status: Optional[Dict[str, str]] = None) -> None:
+    """
+    Publish this process's model status to Redis for the API health check.
+
+    Args:
+        status: Status to publish (defaults to this worker's own models)
+    """
+    if settings.celery_broker_url.startswith("memory://"):
+        return
+    if status is None:
+        status = get_worker_model_status()
+    if not status:
+        return
+    try:
+        key = _model_status_key()
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hset(key, mapping=status)
+        pipe.expire(key, MODEL_STATUS_TTL_SECONDS)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to report model status: {e}")
+
+
+def start_model_status_heartbeat(
+    get_status: Callable[[], Dict[str, str]] = get_worker_model_status,
+) -> None:
+    """
+    Report model status now and keep refreshing it from a background thread.
+
+    Call once per process, after forking; later calls are ignored.
+
+    Args:
+        get_status: Returns the status to publish on each refresh
+    """
+    global _heartbeat_started
+    if settings.celery_broker_url.startswith("memory://"):
+        return
+    with _heartbeat_lock:
+        if _heartbeat_started:
+            return
+        _heartbeat_started = True
+
+    def heartbeat():
+        while True:
+            report_model_status(get_status())
+            time.sleep(MODEL_STATUS_REFRESH_SECONDS)
+
+    threading.Thread(target=heartbeat, name="model-status-heartbeat", daemon=True).start()
+
+
+def get_model_status() -> Dict[str, str]:
+    """
+    Get model status for the health check.
+
+    With a Redis broker the models live in the workers (and the OCR daemon), so
+    combine what the live processes last reported: a model counts as loaded if
+    any of them has it loaded. With the in-memory broker tasks run in this
+    process, so inspect it directly.
+    """
+    if settings.celery_broker_url.startswith("memory://"):
+        return get_local_model_status()
+
+    status = {name: "unknown" for name in MODEL_NAMES}
+    try:
+        redis_client = get_redis()
+        pipe = redis_client.pipeline(transaction=False)
+        for key in redis_client.scan_iter(match=f"{MODEL_STATUS_KEY_PREFIX}*"):
+            pipe.hgetall(key)
+        reports = pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to read model status: {e}")
+        return status
+
+    for report in reports:
+        for name, value in report.items():
+            name = name.decode()
+            if status.get(name) != "loaded":
+                status[name] = value.decode()
+    return status
@@ -1,43 +1,69 @@
 """Arabic text normalization utilities."""
 
 import re
+import unicodedata
 from typing import Optional
 
+# Arabic characters (Unicode range: U+0600-U+06FF)
+ARABIC_CHAR_PATTERN = re.compile(r"[\u0600-\u06FF]")
+
+# Arabic diacritics (tashkeel): Fathatan (U+064B) through Sukun (U+0652)
+TASHKEEL_PATTERN = re.compile(r"[\u064B-\u0652]")
+
+# Anything that is neither a word character nor whitespace
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
 
 def normalize_arabic_text(text: str) -> str:
     """
     Normalize Arabic text by:
+    - Folding compatibility forms (NFKC), e.g. presentation forms and ligatures
     - Unifying different forms of letters (ya, alef, etc.)
-    - Removing tatweel (elongation marks)
+    - Removing tatweel (elongation marks) and tashkeel (diacritics)
     - Normalizing whitespace
     - Preserving punctuation
     """
     if not text:
         return text
 
-    # Remove tatweel (U+0640)
-    text = text.replace("\u0640", "")
-
-    # Normalize different forms of Alef
-    # Alef with Madda (U+0622) -> Alef (U+0627)
-    text = text.replace("\u0622", "\u0627")
-    # Alef with Hamza Above (U+0623) -> Alef (U+0627)
-    text = text.replace("\u0623", "\u0627")
-    # Alef with Hamza Below (U+0625) -> Alef (U+0627)
-    text = text.replace("\u0625", "\u0627")
+    # None of the letter or zero-width rules can apply to ASCII text (page
+    # numbers, Latin captions), so only whitespace needs normalizing
+    if text.isascii():
+        return " ".join(text.split())
+
+    # PDF text layers often carry Arabic presentation forms (U+FB50-U+FEFF)
+    # and lam-alef ligatures; NFKC maps them back to standard letters
+    if not unicodedata.is_normalized("NFKC", text):
+        text = unicodedata.normalize("NFKC", text)
+    text = TASHKEEL_PATTERN.sub("", text)
+
+    # Remove tatweel (U+0640) and normalize different forms of Alef:
+    # Alef with Madda (U+0622), Hamza Above (U+0623) and Hamza Below (U+0625)
+    # -> Alef (U+0627). Chained str.replace calls beat a str.translate table,
+    # which looks up every character in a Python dict.
+    text = (
+        text.replace("\u0640", "")
+        .replace("\u0622", "\u0627")
+        .replace("\u0623", "\u0627")
+        .replace("\u0625", "\u0627")
+    )
 
     # Normalize different forms of Ya
     # Arabic Letter Yeh (U+064A) -> Arabic Letter Farsi Yeh (U+06CC) or keep as is
     # For now, we'll keep both forms but you can unify if needed
 
-    # Normalize whitespace (multiple spaces to single space)
-    text = re.sub(r"\s+", " ", text)
+    # Normalize whitespace (runs of whitespace to a single space); split/join
+    # matches the same characters as a \s+ regex without the regex engine
+    text = " ".join(text.split())
 
-    # Remove zero-width characters
-    text = text.replace("\u200B", "")  # Zero-width space
-    text = text.replace("\u200C", "")  # Zero-width non-joiner
-    text = text.replace("\u200D", "")  # Zero-width joiner
-    text = text.replace("\uFEFF", "")  # Zero-width no-break space
+    # Remove zero-width characters (none can occur in ASCII text)
+    if not text.isascii():
+        text = (
+            text.replace("\u200B", "")  # Zero-width space
+            .replace("\u200C", "")  # Zero-width non-joiner
+            .replace("\u200D", "")  # Zero-width joiner
+            .replace("\uFEFF", "")  # Zero-width no-break space
+        )
 
     # Trim whitespace
     text = text.strip()
@@ -53,11 +79,11 @@ def detect_language(text: str) -> Optional[str]:
     if not text:
         return None
 
-    # Check for Arabic characters (Unicode range: U+0600-U+06FF)
-    arabic_pattern = re.compile(r"[\u0600-\u06FF]")
-    has_arabic = bool(arabic_pattern.search(text))
+    # Pure ASCII text cannot contain Arabic characters
+    if text.isascii():
+        return "en"
 
-    if has_arabic:
+    if ARABIC_CHAR_PATTERN.search(text):
         return "ar"
     return "en"
 
@@ -79,7 +105,7 @@ def clean_text(text: str, preserve_punctuation: bool = True) -> str:
         pass
     else:
         # Remove all punctuation
-        text = re.sub(r"[^\w\s]", "", text)
+        text = PUNCTUATION_PATTERN.sub("", text)
 
     return text
 
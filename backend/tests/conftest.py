@@ -0,0 +1,63 @@
+"""Shared pytest fixtures."""
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import main
+from app.api import routes
+from app.database import Base, _json_serializer, get_db
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def db_engine(tmp_path_factory):
+    """SQLite engine in a temporary directory, so tests never touch the configured database."""
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_sessionmaker(db_engine):
+    """Session factory bound to the test database."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+
+@pytest.fixture
+def db_session(db_sessionmaker):
+    """Session on the test database for checking what the API wrote."""
+    db = db_sessionmaker()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def client(db_engine, db_sessionmaker):
+    """Build the app client once per test session, running startup and shutdown."""
+
+    def override_get_db():
+        db = db_sessionmaker()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    # Startup and the health check use the engine directly
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main, "engine", db_engine)
+        mp.setattr(routes, "engine", db_engine)
+        with TestClient(app) as test_client:
+            yield test_client
+    app.dependency_overrides.clear()
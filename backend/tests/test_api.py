@@ -1,19 +1,19 @@
 """Tests for API endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
+from app.api import routes
+from app.config import get_settings
+from app.models import Job
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/api/health")
     assert response.status_code in [200, 503]  # May be degraded if models not loaded
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
@@ -27,5 +27,27 @@ def test_create_job():
     pass
 
 
-
-
+def test_create_jobs_bulk(client, db_session, tmp_path, monkeypatch):
+    """Test that a bulk upload larger than one file's limit creates a job per file."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "upload_dir", tmp_path)
+    # max_file_size_bytes is a cached property, so override the cached value
+    monkeypatch.setitem(settings.__dict__, "max_file_size_bytes", 100 * 1024)
+    enqueued = []
+    monkeypatch.setattr(
+        routes.process_document_task,
+        "apply",
+        lambda args: enqueued.append(args[0]),
+    )
+
+    # Together the files exceed the single-upload request limit
+    files = [("files", (f"page{i}.png", b"x" * (80 * 1024), "image/png")) for i in range(3)]
+    response = client.post("/api/jobs/bulk", files=files)
+
+    assert response.status_code == 201
+    job_ids = [job["job_id"] for job in response.json()["jobs"]]
+    assert len(job_ids) == 3
+    assert enqueued == job_ids
+
+    jobs = db_session.query(Job).filter(Job.id.in_(job_ids)).all()
+    assert sorted(job.original_filename for job in jobs) == ["page0.png", "page1.png", "page2.png"]
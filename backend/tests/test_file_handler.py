@@ -0,0 +1,65 @@
+"""Tests for file handling utilities."""
+
+import hashlib
+import io
+import tempfile
+
+import pytest
+from app.utils import file_handler
+from app.utils.file_handler import FileTooLargeError, calculate_file_hash, save_uploaded_file
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    """Redirect uploads to a temporary directory."""
+    monkeypatch.setattr(file_handler.settings, "upload_dir", tmp_path)
+    return tmp_path
+
+
+def test_save_uploaded_file_streams_to_disk(upload_dir):
+    """Test that uploads are written to disk in full."""
+    content = b"x" * (file_handler.UPLOAD_CHUNK_SIZE + 123)
+    file_path, unique_filename, file_size = save_uploaded_file(io.BytesIO(content), "doc.pdf")
+
+    assert file_path.parent == upload_dir
+    assert unique_filename.endswith(".pdf")
+    assert file_size == len(content)
+    assert file_path.read_bytes() == content
+
+
+def test_save_uploaded_file_copies_spooled_upload(upload_dir):
+    """Test that uploads spooled to disk are copied from the current position."""
+    content = b"y" * (file_handler.UPLOAD_CHUNK_SIZE + 123)
+    with tempfile.SpooledTemporaryFile(max_size=1024) as spooled:
+        spooled.write(b"skip" + content)
+        spooled.seek(4)
+        file_path, _, file_size = save_uploaded_file(spooled, "doc.pdf")
+
+    assert file_size == len(content)
+    assert file_path.read_bytes() == content
+
+
+def test_save_uploaded_file_rejects_oversized(upload_dir):
+    """Test that oversized uploads are rejected and the partial file removed."""
+    with pytest.raises(FileTooLargeError):
+        save_uploaded_file(io.BytesIO(b"x" * 100), "doc.pdf", max_size=10)
+
+    assert list(upload_dir.iterdir()) == []
+
+    with tempfile.TemporaryFile() as on_disk:
+        on_disk.write(b"x" * 100)
+        on_disk.seek(0)
+        with pytest.raises(FileTooLargeError):
+            save_uploaded_file(on_disk, "doc.pdf", max_size=10)
+
+    assert list(upload_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("size", [0, 1000, file_handler.HASH_MMAP_MIN_SIZE + 1])
+def test_calculate_file_hash(tmp_path, size):
+    """Test that small (chunked) and large (memory-mapped) files hash correctly."""
+    content = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+    file_path = tmp_path / "doc.pdf"
+    file_path.write_bytes(content)
+
+    assert calculate_file_hash(file_path) == hashlib.sha256(content).hexdigest()
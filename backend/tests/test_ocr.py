@@ -1,7 +1,13 @@
 """Tests for OCR service."""
 
+import os
 import pytest
 from pathlib import Path
+
+import cv2
+import numpy as np
+
+from app.services import ocr
 from app.services.ocr import extract_text_from_image, preprocess_image
 
 
@@ -22,5 +28,63 @@ def test_preprocess_image():
     pass
 
 
+def test_extract_text_from_image_passes_array_without_temp_files(tmp_path, monkeypatch):
+    """Test that the preprocessed image reaches the engine in memory."""
+    image_path = tmp_path / "page.png"
+    cv2.imwrite(str(image_path), np.full((40, 60, 3), 255, dtype=np.uint8))
+
+    received = []
+
+    def fake_paddleocr(image):
+        received.append(image)
+        return [("نص", 0.9, [0, 0, 10, 10])]
+
+    monkeypatch.setattr(ocr, "ocr_with_paddleocr", fake_paddleocr)
+    monkeypatch.setattr(ocr.settings, "use_ocr_cache", False)
+    blocks = extract_text_from_image(image_path, page_index=0, engine="paddleocr")
+
+    assert len(blocks) == 1
+    assert isinstance(received[0], np.ndarray)
+    assert list(tmp_path.iterdir()) == [image_path]
+
+
+def test_prune_ocr_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Test that pruning deletes the oldest cache entries until the cache fits."""
+    monkeypatch.setattr(ocr.settings, "upload_dir", tmp_path)
+    cache_dir = tmp_path / "ocr_cache"
+    cache_dir.mkdir()
+    for age, name in enumerate(["new", "middle", "old"]):
+        entry = cache_dir / f"{name}.json"
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (1000 - age, 1000 - age))
+
+    assert ocr.prune_ocr_cache(max_bytes=150) == 2
+    assert [path.name for path in cache_dir.iterdir()] == ["new.json"]
+
+
+def test_ocr_cache_key_covers_engine_settings(monkeypatch):
+    """Test that changing OCR settings changes the cache key."""
+    image = np.zeros((4, 4), dtype=np.uint8)
+    before = ocr._ocr_cache_path(image, "paddleocr", True)
+
+    monkeypatch.setattr(ocr.settings, "tesseract_lang", "ara+eng")
+    ocr._ocr_cache_config_key.cache_clear()
+    try:
+        assert ocr._ocr_cache_path(image, "paddleocr", True) != before
+    finally:
+        ocr._ocr_cache_config_key.cache_clear()
+
+
+def test_denoise_smooths_scan_with_saturated_background():
+    """Test that a scan with a clipped white point still gets denoised."""
+    rng = np.random.default_rng(0)
+    scan = np.full((200, 200), 255, dtype=np.uint8)
+    scan[80:120, 20:180] = 0
+    # Isolated mid-gray speckles on an otherwise pure white background
+    ys, xs = rng.integers(0, 200, size=(2, 400))
+    scan[ys, xs] = 128
 
+    denoised = ocr.denoise(scan, mode="median")
+    assert np.count_nonzero(denoised == 128) < np.count_nonzero(scan == 128) // 10
 
+    assert ocr.denoise(scan, mode="median", source="digital") is scan